@@ -2,8 +2,12 @@
 Main Blackjack Game class - ties together all components
 """
 
+import math
+import time
 import tkinter as tk
 from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import List, Optional, Tuple
 
 from config import (
@@ -18,15 +22,46 @@ from config import (
 from models import Player, PlayerType, AnimationManager, DeckPosition
 from game_logic import (
     create_deck, get_card_value, get_hilo_value,
-    calculate_hand_score, calculate_running_count, calculate_true_count,
+    add_card_to_score, EMPTY_HAND_SCORE,
+    calculate_true_count,
     get_ai_decision
 )
 from ui_components import (
-    lighten_color, add_hover_effect, create_card_widget, setup_ttk_styles,
-    create_card_back_canvas, create_discard_pile_widget
+    lighten_color, add_hover_effect, setup_ttk_styles, setup_fonts, get_font,
+    create_card_canvas, update_card_widget,
+    create_card_back_label, create_discard_pile_widget
 )
 
 
+# Discard tray layout: fixed header, then one row per rank whose only
+# changing part is the seen count between a static prefix and suffix
+_DISCARD_HEADER = "  Card │ Seen │ Hi-Lo\n  ─────┼──────┼──────\n"
+_DISCARD_ROW_PARTS = {
+    rank: (f"  {rank:>3}  │  ",
+           "  │  " + (f"+{HILO_VALUES[rank]}" if HILO_VALUES[rank] > 0
+                     else str(HILO_VALUES[rank]) if HILO_VALUES[rank] < 0 else " 0"))
+    for rank in RANKS
+}
+
+# Player frame colours per state, resolved from the palette once:
+# (glow, frame, inner, status text, status colour)
+_PLAYER_FRAME_STYLES = {
+    'normal': (COLORS['player_frame_normal'], COLORS['player_frame_normal'],
+               COLORS['player_frame_inner'], "", COLORS['text_muted']),
+    # BUST - Red glow effect, dark reddish interior
+    'busted': (COLORS['glow_bust'], COLORS['glow_bust'], '#3d2a2a',
+               "💥 BUSTED!", COLORS['danger']),
+    # WIN - Gold glow effect, warm golden interior
+    'winner': (COLORS['glow_win'], COLORS['glow_win'], '#3d3a2a',
+               "🏆 WINNER!", COLORS['gold']),
+    'standing': (COLORS['player_frame_normal'], COLORS['player_frame_normal'],
+                 COLORS['player_frame_inner'], "✓ Standing", COLORS['success']),
+    # Active player - subtle green glow
+    'active': (COLORS['glow_active'], COLORS['player_frame_active'],
+               COLORS['player_frame_active'], "► YOUR TURN", COLORS['gold']),
+}
+
+
 class BlackjackGame:
     """Main game controller class"""
     
@@ -46,38 +81,68 @@ class BlackjackGame:
         self.auto_deal_delay = tk.IntVar(value=DEFAULT_AUTO_DEAL_DELAY)
         self.ai_skill = tk.IntVar(value=DEFAULT_AI_SKILL)
         self.dealing_speed = tk.IntVar(value=DEFAULT_DEALING_SPEED)
+        self._dealing_speed = DEFAULT_DEALING_SPEED
         
         # Visibility toggles
         self.show_running_count = tk.BooleanVar(value=True)
         self.show_true_count = tk.BooleanVar(value=True)
         self.show_discard_tray = tk.BooleanVar(value=True)
         self.show_hilo_chart = tk.BooleanVar(value=True)
+        # Python-side copy of (running, true, discard) visibility for the hot display path
+        self._aids_shown = (True, True, True)
         self.show_hilo_on_cards = tk.BooleanVar(value=True)  # Hi-Lo values on cards
         self.training_mode = tk.BooleanVar(value=True)
         
         # Game state
-        self.deck = []
+        self.deck = ()
+        self._deck_cursor = 0           # Index of the next card to deal from self.deck
+        self._shuffle_pool = ThreadPoolExecutor(max_workers=1)
+        self._next_shoe = None          # (num_decks, Future) for the pre-shuffled next shoe
         self.discarded_cards = []      # All discarded (for reshuffling)
         self.visible_cards = []         # Only visible cards (for counting)
+        self._running_count = 0         # Hi-Lo count of visible_cards, kept incrementally
+        self._discard_counts = {rank: 0 for rank in RANKS}
+        self._discard_rows = {}         # rank -> formatted tray row
+        self._discard_written_count = None  # Visible cards shown in the tray (None = rebuild)
         self.players: List[Player] = []
+        self._last_player_config = None  # (num, types, ai_skill) the player frames were built for
+        self._busted_players = 0        # Players busted this hand, counted by _bust_player
         self.dealer_hand = []
+        self._hand_scores = {}          # id(hand) -> (score, hard total, has ace), updated per dealt card
         self.dealer_hole_card = None
         self.current_player_index = 0
         self.game_over = False
         self.game_started = False
         self.timer_id = None
         self.time_remaining = 0
+        self._timer_deadline = 0.0
         self.auto_deal_id = None
+        self.visibility_id = None
+        self.deck_visual_id = None
+        self.discard_visual_id = None
         self.is_paused = False
+        self._window_visible = True     # False while the main window is minimized
+        self._hidden_since = 0.0
+        self._held_callbacks = []       # Game-loop steps waiting for the window to be mapped
+        self._resumed_ids = []          # after ids of held steps restarted on restore
+        self._batch_depth = 0           # > 0 while display refreshes are being coalesced
+        self._display_dirty = False
         
         # Player configurations (type for each slot)
-        self.player_types = [tk.StringVar(value="Human") for _ in range(5)]
+        self.player_types = ["Human"] * 5
+        
+        # Direct Tcl entry point for hot widget updates (see _configure)
+        self._tk_call = self.root.tk.call
+        self._last_options = {}  # widget path -> {option: value} last written
         
         # Animation manager and deck position
         self.animation = AnimationManager(self)
         self.deck_position = DeckPosition()
         
-        # Setup UI
+        # Setup UI - keep the window hidden while it is built so Tk computes
+        # the geometry once instead of after every pack()
+        self.root.withdraw()
+        setup_fonts(self.root)
         setup_ttk_styles()
         self._setup_gui()
         self.settings_window = None
@@ -86,6 +151,13 @@ class BlackjackGame:
         self._update_counting_display()
         self._update_discard_display()
         
+        self.root.update_idletasks()
+        self.root.deiconify()
+        
+        # Hold the dealing/AI/dealer chains while the window is minimized
+        self.root.bind('<Unmap>', self._on_window_unmap)
+        self.root.bind('<Map>', self._on_window_map)
+        
     # ═══════════════════════════════════════════════════════════════
     # UI SETUP METHODS
     # ═══════════════════════════════════════════════════════════════
@@ -122,7 +194,7 @@ class BlackjackGame:
         left_section.pack(side='left', padx=15, fill='y')
         
         settings_btn = tk.Button(left_section, text="⚙ SETTINGS", 
-                                font=('Trebuchet MS', 9, 'bold'),
+                                font=get_font('button_sm'),
                                 bg=COLORS['bg_elevated'], fg=COLORS['text_secondary'],
                                 relief='flat', cursor='hand2', padx=12, pady=4,
                                 activebackground=COLORS['bg_panel'],
@@ -138,18 +210,18 @@ class BlackjackGame:
         title_frame = tk.Frame(center_section, bg=COLORS['bg_secondary'])
         title_frame.pack(expand=True)
         
-        tk.Label(title_frame, text="♠ ♥", font=('Times New Roman', 16),
+        tk.Label(title_frame, text="♠ ♥", font=get_font('ornament'),
                 bg=COLORS['bg_secondary'], fg=COLORS['gold_dim']).pack(side='left', padx=8)
         
         tk.Label(title_frame, text="PRIVATE CLUB",
-                font=('Palatino Linotype', 20, 'bold'),
+                font=get_font('title'),
                 bg=COLORS['bg_secondary'], fg=COLORS['gold']).pack(side='left')
         
-        tk.Label(title_frame, text="♦ ♣", font=('Times New Roman', 16),
+        tk.Label(title_frame, text="♦ ♣", font=get_font('ornament'),
                 bg=COLORS['bg_secondary'], fg=COLORS['gold_dim']).pack(side='left', padx=8)
         
         tk.Label(center_section, text="CARD COUNTING TRAINER",
-                font=('Trebuchet MS', 9, 'bold'),
+                font=get_font('button_sm'),
                 bg=COLORS['bg_secondary'], fg=COLORS['text_muted']).pack()
         
         # Right section - Info and mode
@@ -157,12 +229,12 @@ class BlackjackGame:
         right_section.pack(side='right', padx=15, fill='y')
         
         self.deck_info_label = tk.Label(right_section, text="DECK: 52/52",
-                                       font=('Consolas', 9),
+                                       font=get_font('mono_sm'),
                                        bg=COLORS['bg_secondary'], fg=COLORS['text_muted'])
         self.deck_info_label.pack(side='top', pady=(10, 3))
         
         self.mode_btn = tk.Button(right_section, text="🎓 TRAINING", 
-                                 font=('Trebuchet MS', 9, 'bold'),
+                                 font=get_font('button_sm'),
                                  bg=COLORS['emerald_dark'], fg=COLORS['text_primary'],
                                  relief='flat', cursor='hand2', padx=10, pady=2,
                                  activebackground=COLORS['emerald'],
@@ -191,7 +263,7 @@ class BlackjackGame:
         header.pack(fill='x')
         header.pack_propagate(False)
         
-        tk.Label(header, text="📊 CARD COUNTING", font=('Trebuchet MS', 11, 'bold'),
+        tk.Label(header, text="📊 CARD COUNTING", font=get_font('body_bold'),
                 bg=COLORS['bg_panel'], fg=COLORS['gold']).pack(expand=True)
         
         # Stats container
@@ -211,10 +283,10 @@ class BlackjackGame:
         cards_inner = tk.Frame(cards_frame, bg=COLORS['bg_elevated'])
         cards_inner.pack(fill='x', padx=10, pady=6)
         
-        tk.Label(cards_inner, text="CARDS LEFT", font=('Trebuchet MS', 8),
+        tk.Label(cards_inner, text="CARDS LEFT", font=get_font('label'),
                 bg=COLORS['bg_elevated'], fg=COLORS['text_muted']).pack()
         self.cards_remaining_label = tk.Label(cards_inner, text="52",
-                                             font=('Consolas', 16, 'bold'),
+                                             font=get_font('mono_lg_bold'),
                                              bg=COLORS['bg_elevated'], fg=COLORS['text_primary'])
         self.cards_remaining_label.pack()
         
@@ -225,7 +297,7 @@ class BlackjackGame:
         hilo_inner = tk.Frame(self.hilo_frame, bg=COLORS['bg_elevated'])
         hilo_inner.pack(fill='x', padx=8, pady=6)
         
-        tk.Label(hilo_inner, text="HI-LO REFERENCE", font=('Trebuchet MS', 8, 'bold'),
+        tk.Label(hilo_inner, text="HI-LO REFERENCE", font=get_font('label_bold'),
                 bg=COLORS['bg_elevated'], fg=COLORS['gold']).pack(pady=(0, 5))
         
         chart = tk.Frame(hilo_inner, bg=COLORS['bg_elevated'])
@@ -238,11 +310,11 @@ class BlackjackGame:
         ]:
             row = tk.Frame(chart, bg=COLORS['bg_elevated'])
             row.pack(fill='x', pady=1)
-            tk.Label(row, text=value, font=('Consolas', 9, 'bold'), width=3,
+            tk.Label(row, text=value, font=get_font('mono_sm_bold'), width=3,
                     bg=COLORS['bg_elevated'], fg=color).pack(side='left')
-            tk.Label(row, text="→", font=('Arial', 8),
+            tk.Label(row, text="→", font=get_font('arrow'),
                     bg=COLORS['bg_elevated'], fg=COLORS['text_muted']).pack(side='left', padx=3)
-            tk.Label(row, text=cards, font=('Consolas', 9),
+            tk.Label(row, text=cards, font=get_font('mono_sm'),
                     bg=COLORS['bg_elevated'], fg=COLORS['text_secondary']).pack(side='left')
         
         # Discard Tray
@@ -252,15 +324,15 @@ class BlackjackGame:
         discard_header = tk.Frame(self.discard_frame, bg=COLORS['bg_elevated'])
         discard_header.pack(fill='x', padx=8, pady=(6, 3))
         
-        tk.Label(discard_header, text="DISCARD TRAY", font=('Trebuchet MS', 8, 'bold'),
+        tk.Label(discard_header, text="DISCARD TRAY", font=get_font('label_bold'),
                 bg=COLORS['bg_elevated'], fg=COLORS['gold']).pack()
         
-        self.discard_text = tk.Text(self.discard_frame, font=('Consolas', 8),
-                                   bg=COLORS['bg_panel'], fg=COLORS['text_secondary'],
-                                   height=16, width=25, relief='flat', 
-                                   state='disabled', padx=6, pady=6,
-                                   selectbackground=COLORS['gold_dim'])
-        self.discard_text.pack(padx=8, pady=(0, 6))
+        # Read-only table - a Label is rewritten with one configure, unlike a Text
+        self.discard_label = tk.Label(self.discard_frame, font=get_font('mono_xs'),
+                                      bg=COLORS['bg_panel'], fg=COLORS['text_secondary'],
+                                      height=16, width=25, relief='flat',
+                                      padx=6, pady=6, justify='left', anchor='nw')
+        self.discard_label.pack(padx=8, pady=(0, 6))
         
         # Toggle section
         toggle_frame = tk.Frame(self.counting_frame, bg=COLORS['bg_panel'])
@@ -276,7 +348,7 @@ class BlackjackGame:
             ("Discard Tray", self.show_discard_tray)
         ]:
             cb = tk.Checkbutton(toggle_inner, text=text, variable=var,
-                               font=('Trebuchet MS', 8), bg=COLORS['bg_panel'],
+                               font=get_font('label'), bg=COLORS['bg_panel'],
                                fg=COLORS['text_secondary'], selectcolor=COLORS['bg_elevated'],
                                activebackground=COLORS['bg_panel'],
                                activeforeground=COLORS['text_primary'],
@@ -291,11 +363,11 @@ class BlackjackGame:
         inner = tk.Frame(frame, bg=COLORS['bg_elevated'])
         inner.pack(fill='x', padx=10, pady=8)
         
-        tk.Label(inner, text=title, font=('Trebuchet MS', 8),
+        tk.Label(inner, text=title, font=get_font('label'),
                 bg=COLORS['bg_elevated'], fg=COLORS['text_muted']).pack()
         
         value_label = tk.Label(inner, text=value,
-                              font=('Consolas', 24, 'bold'),
+                              font=get_font('mono_xl_bold'),
                               bg=COLORS['bg_elevated'], fg=color)
         value_label.pack(pady=(2, 0))
         
@@ -325,16 +397,17 @@ class BlackjackGame:
         # Deck visual - initially positioned above dealer header, will move to top middle when dealing starts
         self.deck_visual_frame = tk.Frame(self.table_inner, bg=COLORS['bg_card_table'])
         self.deck_visual_frame.pack(pady=(0, 8))
+        self._setup_deck_visual()
         self._create_deck_visual()
         
         dealer_header = tk.Frame(dealer_section, bg=COLORS['bg_card_table'])
         dealer_header.pack()
         
-        tk.Label(dealer_header, text="━━━", font=('Arial', 12),
+        tk.Label(dealer_header, text="━━━", font=get_font('rule'),
                 bg=COLORS['bg_card_table'], fg=COLORS['gold_dim']).pack(side='left')
-        tk.Label(dealer_header, text=" DEALER ", font=('Palatino Linotype', 14, 'bold'),
+        tk.Label(dealer_header, text=" DEALER ", font=get_font('heading'),
                 bg=COLORS['bg_card_table'], fg=COLORS['gold']).pack(side='left')
-        tk.Label(dealer_header, text="━━━", font=('Arial', 12),
+        tk.Label(dealer_header, text="━━━", font=get_font('rule'),
                 bg=COLORS['bg_card_table'], fg=COLORS['gold_dim']).pack(side='left')
         
         # Dealer cards container with fixed background
@@ -343,9 +416,10 @@ class BlackjackGame:
         
         self.dealer_cards_frame = tk.Frame(self.dealer_cards_container, bg=COLORS['bg_card_table'])
         self.dealer_cards_frame.pack()
+        self._dealer_card_row = self._create_card_row(self.dealer_cards_frame, padx=4)
         
         self.dealer_score_label = tk.Label(dealer_section, text="",
-                                          font=('Trebuchet MS', 11),
+                                          font=get_font('body'),
                                           bg=COLORS['bg_card_table'], fg=COLORS['text_primary'])
         self.dealer_score_label.pack()
         
@@ -360,51 +434,80 @@ class BlackjackGame:
         self.players_container.pack(fill='both', expand=True, pady=5)
         
         self.player_frames = []
+        self._player_columns = 0  # Grid columns currently configured in players_container
         
-    def _create_deck_visual(self):
-        """Create the visual deck representation using actual card back widgets"""
-        for widget in self.deck_visual_frame.winfo_children():
-            widget.destroy()
-        
+    def _setup_deck_visual(self):
+        """Create the static parts of the deck visual (stack container and label)"""
         # Container for stacked cards
-        stack_container = tk.Frame(self.deck_visual_frame, bg=COLORS['bg_card_table'])
-        stack_container.pack()
-        
-        # Calculate how many card backs to show based on deck size
-        max_visible = 5
-        num_visible = min(max_visible, max(1, len(self.deck) // 10))
+        self.deck_stack_container = tk.Frame(self.deck_visual_frame, bg=COLORS['bg_card_table'])
+        self.deck_stack_container.pack()
         
         # Use consistent container size for alignment (always max_visible)
+        max_visible = 5
         stack_offset = 2
         total_width = CARD_WIDTH + (max_visible - 1) * stack_offset + 4
         total_height = CARD_HEIGHT + (max_visible - 1) * stack_offset + 4
         
-        # Use a frame to stack actual card back canvases
-        for i in range(num_visible):
-            # Create actual card back using the same function as dealer cards
-            card_back = create_card_back_canvas(stack_container)
-            # Offset from end position so cards align at bottom-right
-            offset_start = (max_visible - num_visible) * stack_offset
-            card_back.place(x=offset_start + i * stack_offset, y=offset_start + i * stack_offset)
-        
         # Set container size - always same size for consistent alignment
-        stack_container.config(width=total_width, height=total_height)
-        stack_container.pack_propagate(False)
+        self.deck_stack_container.config(width=total_width, height=total_height)
+        self.deck_stack_container.pack_propagate(False)
         
         # Deck label
         tk.Label(
             self.deck_visual_frame,
             text="DECK",
-            font=('Trebuchet MS', 8),
+            font=get_font('label'),
             bg=COLORS['bg_card_table'],
             fg=COLORS['text_muted']
         ).pack(pady=(3, 0))
         
-        # Store deck position for animations
-        self.deck_visual_frame.update_idletasks()
+        self._deck_stack_cards = []
+        self._deck_stack_count = -1
+        
+    def _request_deck_visual(self):
+        """Schedule a deck stack refresh - every card dealt in one pass shares a single redraw"""
+        # Most deals leave the stack height alone, so do not even schedule those
+        if self.deck_visual_id is None and self._deck_stack_height() != self._deck_stack_count:
+            self.deck_visual_id = self.root.after_idle(self._create_deck_visual)
+            
+    def _request_discard_pile_visual(self):
+        """Schedule a discard pile refresh, coalescing repeated requests the same way"""
+        if self.discard_visual_id is None:
+            self.discard_visual_id = self.root.after_idle(self._update_visual_discard_pile)
+            
+    def _deck_stack_height(self):
+        """Number of card backs the deck stack shows - one per ten cards left, 1 to 5"""
+        return min(5, max(1, self._cards_remaining() // 10))
+        
+    def _create_deck_visual(self):
+        """Update the visual deck stack - card backs are only created or destroyed when its height changes"""
+        self.deck_visual_id = None
+        
+        # Calculate how many card backs to show based on deck size
+        max_visible = 5
+        num_visible = self._deck_stack_height()
+        if num_visible == self._deck_stack_count:
+            return
+            
+        # Drop cards from the top of the stack, or add the missing ones on top
+        while len(self._deck_stack_cards) > num_visible:
+            self._deck_stack_cards.pop().destroy()
+        while len(self._deck_stack_cards) < num_visible:
+            # All stack slots share one pre-rendered card back image
+            self._deck_stack_cards.append(create_card_back_label(self.deck_stack_container))
+            
+        # Offset from end position so cards align at bottom-right
+        stack_offset = 2
+        offset_start = (max_visible - num_visible) * stack_offset
+        for i, card_back in enumerate(self._deck_stack_cards):
+            card_back.place(x=offset_start + i * stack_offset, y=offset_start + i * stack_offset)
+            
+        self._deck_stack_count = num_visible
         
     def _update_visual_discard_pile(self):
         """Update the visual discard pile display"""
+        self.discard_visual_id = None
+        
         for widget in self.visual_discard_frame.winfo_children():
             widget.destroy()
             
@@ -424,11 +527,14 @@ class BlackjackGame:
         self.timer_frame = tk.Frame(controls_container, bg=COLORS['bg_secondary'])
         self.timer_frame.pack(fill='x', padx=30, pady=(5, 0))
         
-        self.timer_bar = ttk.Progressbar(self.timer_frame, length=500, mode='determinate',
-                                        style="Gold.Horizontal.TProgressbar")
+        # Plain canvas bar - resizing one rectangle is far cheaper than a themed redraw
+        self.timer_bar = tk.Canvas(self.timer_frame, width=500, height=14,
+                                   bg=COLORS['bg_elevated'], highlightthickness=0)
         self.timer_bar.pack(side='left', padx=(0, 15))
+        self._timer_fill = self.timer_bar.create_rectangle(0, 0, 500, 14,
+                                                           fill=COLORS['gold'], width=0)
         
-        self.timer_label = tk.Label(self.timer_frame, text="", font=('Consolas', 12, 'bold'),
+        self.timer_label = tk.Label(self.timer_frame, text="", font=get_font('mono_md_bold'),
                                    bg=COLORS['bg_secondary'], fg=COLORS['gold'])
         self.timer_label.pack(side='left')
         
@@ -452,7 +558,7 @@ class BlackjackGame:
             btn_frame.grid(row=0, column=i, padx=6, pady=5, sticky='n')
             
             btn = tk.Button(btn_frame, text=f"{icon}\n{text}",
-                           font=('Trebuchet MS', 10, 'bold'),
+                           font=get_font('button'),
                            bg=color, fg='white',
                            width=9, height=2,
                            relief='flat', cursor='hand2',
@@ -461,7 +567,7 @@ class BlackjackGame:
             btn.pack()
             
             # Empty label to match structure of DEAL/NEW buttons
-            tk.Label(btn_frame, text=" ", font=('Trebuchet MS', 7),
+            tk.Label(btn_frame, text=" ", font=get_font('caption'),
                     bg=COLORS['bg_secondary'], fg=COLORS['text_muted']).pack()
             
             self.action_buttons[text.lower()] = btn
@@ -476,7 +582,7 @@ class BlackjackGame:
         deal_frame.grid(row=0, column=4, padx=6, pady=5, sticky='n')
         
         self.deal_button = tk.Button(deal_frame, text="🃏\nDEAL",
-                                    font=('Trebuchet MS', 10, 'bold'),
+                                    font=get_font('button'),
                                     bg=COLORS['btn_deal'], fg='white',
                                     width=9, height=2,
                                     relief='flat', cursor='hand2',
@@ -485,7 +591,7 @@ class BlackjackGame:
         self.deal_button.pack()
         add_hover_effect(self.deal_button, COLORS['btn_deal'], lighten_color(COLORS['btn_deal']))
         
-        tk.Label(deal_frame, text="Same Deck", font=('Trebuchet MS', 7),
+        tk.Label(deal_frame, text="Same Deck", font=get_font('caption'),
                 bg=COLORS['bg_secondary'], fg=COLORS['text_muted']).pack()
         
         # NEW GAME button
@@ -493,7 +599,7 @@ class BlackjackGame:
         new_game_frame.grid(row=0, column=5, padx=6, pady=5, sticky='n')
         
         self.new_game_button = tk.Button(new_game_frame, text="🔄\nNEW",
-                                        font=('Trebuchet MS', 10, 'bold'),
+                                        font=get_font('button'),
                                         bg=COLORS['btn_new_game'], fg='white',
                                         width=9, height=2,
                                         relief='flat', cursor='hand2',
@@ -502,7 +608,7 @@ class BlackjackGame:
         self.new_game_button.pack()
         add_hover_effect(self.new_game_button, COLORS['btn_new_game'], lighten_color(COLORS['btn_new_game']))
         
-        tk.Label(new_game_frame, text="Fresh Deck", font=('Trebuchet MS', 7),
+        tk.Label(new_game_frame, text="Fresh Deck", font=get_font('caption'),
                 bg=COLORS['bg_secondary'], fg=COLORS['text_muted']).pack()
         
         # PAUSE button
@@ -510,7 +616,7 @@ class BlackjackGame:
         pause_frame.grid(row=0, column=6, padx=6, pady=5, sticky='n')
         
         self.pause_button = tk.Button(pause_frame, text="⏸\nPAUSE",
-                                     font=('Trebuchet MS', 10, 'bold'),
+                                     font=get_font('button'),
                                      bg=COLORS['bg_elevated'], fg='white',
                                      width=9, height=2,
                                      relief='flat', cursor='hand2',
@@ -520,7 +626,7 @@ class BlackjackGame:
         add_hover_effect(self.pause_button, COLORS['bg_elevated'], lighten_color(COLORS['bg_elevated']))
         
         # Empty label to match structure of DEAL/NEW buttons
-        tk.Label(pause_frame, text=" ", font=('Trebuchet MS', 7),
+        tk.Label(pause_frame, text=" ", font=get_font('caption'),
                 bg=COLORS['bg_secondary'], fg=COLORS['text_muted']).pack()
         
         # Store references
@@ -531,7 +637,7 @@ class BlackjackGame:
         # Status label
         self.status_label = tk.Label(controls_container, 
                                     text="♠ ♥ Welcome to the Private Club ♦ ♣",
-                                    font=('Palatino Linotype', 11),
+                                    font=get_font('status'),
                                     bg=COLORS['bg_secondary'], fg=COLORS['gold'])
         self.status_label.pack(pady=(0, 8))
         
@@ -540,8 +646,11 @@ class BlackjackGame:
     # ═══════════════════════════════════════════════════════════════
     
     def _show_settings(self):
-        """Show settings dialog"""
+        """Show settings dialog - built on first open, then withdrawn and reused"""
         if self.settings_window and self.settings_window.winfo_exists():
+            # Widgets are bound to the Tk variables; only the skill label is not
+            self._on_ai_skill_change(self.ai_skill.get())
+            self.settings_window.deiconify()
             self.settings_window.lift()
             return
             
@@ -551,6 +660,7 @@ class BlackjackGame:
         self.settings_window.configure(bg=COLORS['bg_primary'])
         self.settings_window.resizable(False, False)
         self.settings_window.transient(self.root)
+        self.settings_window.protocol('WM_DELETE_WINDOW', self.settings_window.withdraw)
         
         # Header
         header = tk.Frame(self.settings_window, bg=COLORS['bg_secondary'], height=60)
@@ -558,7 +668,7 @@ class BlackjackGame:
         header.pack_propagate(False)
         
         tk.Label(header, text="⚙  GAME SETTINGS",
-                font=('Palatino Linotype', 18, 'bold'),
+                font=get_font('dialog_title'),
                 bg=COLORS['bg_secondary'], fg=COLORS['gold']).pack(expand=True)
         
         # Content
@@ -572,7 +682,7 @@ class BlackjackGame:
         
         # Player configuration
         tk.Label(content, text="PLAYER CONFIGURATION",
-                font=('Trebuchet MS', 11, 'bold'),
+                font=get_font('body_bold'),
                 bg=COLORS['bg_primary'], fg=COLORS['gold']).pack(fill='x', pady=(20, 10), anchor='w')
         
         self.player_config_frame = tk.Frame(content, bg=COLORS['bg_elevated'])
@@ -583,11 +693,12 @@ class BlackjackGame:
         ai_frame = tk.Frame(content, bg=COLORS['bg_primary'])
         ai_frame.pack(fill='x', pady=15)
         
-        tk.Label(ai_frame, text="AI Skill Level:", font=('Trebuchet MS', 11),
+        tk.Label(ai_frame, text="AI Skill Level:", font=get_font('body'),
                 bg=COLORS['bg_primary'], fg=COLORS['text_primary']).pack(side='left')
         
-        self.ai_skill_label = tk.Label(ai_frame, text=f"{self.ai_skill.get()}%",
-                                      font=('Consolas', 11, 'bold'),
+        self._last_ai_pct = self.ai_skill.get()
+        self.ai_skill_label = tk.Label(ai_frame, text=f"{self._last_ai_pct}%",
+                                      font=get_font('mono_bold'),
                                       bg=COLORS['bg_primary'], fg=COLORS['gold'])
         self.ai_skill_label.pack(side='right')
         
@@ -596,7 +707,7 @@ class BlackjackGame:
                            fg=COLORS['text_primary'], highlightthickness=0,
                            length=200, troughcolor=COLORS['bg_panel'],
                            activebackground=COLORS['gold'],
-                           command=lambda v: self.ai_skill_label.config(text=f"{int(float(v))}%"))
+                           command=self._on_ai_skill_change)
         ai_scale.pack(side='right', padx=10)
         
         # Timer settings
@@ -604,14 +715,14 @@ class BlackjackGame:
         timer_frame.pack(fill='x', pady=10)
         
         tk.Checkbutton(timer_frame, text="Enable Turn Timer", variable=self.timer_enabled,
-                      font=('Trebuchet MS', 11), bg=COLORS['bg_primary'],
+                      font=get_font('body'), bg=COLORS['bg_primary'],
                       fg=COLORS['text_primary'], selectcolor=COLORS['bg_elevated'],
                       activebackground=COLORS['bg_primary']).pack(side='left')
         
-        tk.Label(timer_frame, text="sec", font=('Trebuchet MS', 10),
+        tk.Label(timer_frame, text="sec", font=get_font('body_sm'),
                 bg=COLORS['bg_primary'], fg=COLORS['text_muted']).pack(side='right')
         tk.Spinbox(timer_frame, from_=5, to=30, textvariable=self.timer_duration,
-                  width=5, font=('Consolas', 11), bg=COLORS['bg_elevated'],
+                  width=5, font=get_font('mono'), bg=COLORS['bg_elevated'],
                   fg=COLORS['text_primary']).pack(side='right', padx=5)
         
         # Auto-deal settings
@@ -619,25 +730,25 @@ class BlackjackGame:
         auto_frame.pack(fill='x', pady=10)
         
         tk.Checkbutton(auto_frame, text="Auto-Deal Next Hand", variable=self.auto_deal_enabled,
-                      font=('Trebuchet MS', 11), bg=COLORS['bg_primary'],
+                      font=get_font('body'), bg=COLORS['bg_primary'],
                       fg=COLORS['text_primary'], selectcolor=COLORS['bg_elevated'],
                       activebackground=COLORS['bg_primary']).pack(side='left')
         
-        tk.Label(auto_frame, text="sec delay", font=('Trebuchet MS', 10),
+        tk.Label(auto_frame, text="sec delay", font=get_font('body_sm'),
                 bg=COLORS['bg_primary'], fg=COLORS['text_muted']).pack(side='right')
         tk.Spinbox(auto_frame, from_=1, to=5, textvariable=self.auto_deal_delay,
-                  width=5, font=('Consolas', 11), bg=COLORS['bg_elevated'],
+                  width=5, font=get_font('mono'), bg=COLORS['bg_elevated'],
                   fg=COLORS['text_primary']).pack(side='right', padx=5)
         
         # Dealing Speed slider
         speed_frame = tk.Frame(content, bg=COLORS['bg_primary'])
         speed_frame.pack(fill='x', pady=15)
         
-        tk.Label(speed_frame, text="Dealing Speed:", font=('Trebuchet MS', 11),
+        tk.Label(speed_frame, text="Dealing Speed:", font=get_font('body'),
                 bg=COLORS['bg_primary'], fg=COLORS['text_primary']).pack(side='left')
         
-        self.dealing_speed_label = tk.Label(speed_frame, text=f"{self.dealing_speed.get()}%",
-                                      font=('Consolas', 11, 'bold'),
+        self.dealing_speed_label = tk.Label(speed_frame, text=f"{self._dealing_speed}%",
+                                      font=get_font('mono_bold'),
                                       bg=COLORS['bg_primary'], fg=COLORS['gold'])
         self.dealing_speed_label.pack(side='right')
         
@@ -646,12 +757,12 @@ class BlackjackGame:
                            fg=COLORS['text_primary'], highlightthickness=0,
                            length=200, troughcolor=COLORS['bg_panel'],
                            activebackground=COLORS['gold'],
-                           command=lambda v: self.dealing_speed_label.config(text=f"{int(float(v))}%"))
+                           command=self._on_dealing_speed_change)
         speed_scale.pack(side='right', padx=10)
         
         # Display settings header
         tk.Label(content, text="DISPLAY OPTIONS",
-                font=('Trebuchet MS', 11, 'bold'),
+                font=get_font('body_bold'),
                 bg=COLORS['bg_primary'], fg=COLORS['gold']).pack(fill='x', pady=(20, 10), anchor='w')
         
         # Hi-Lo on cards toggle
@@ -660,14 +771,14 @@ class BlackjackGame:
         
         tk.Checkbutton(hilo_cards_frame, text="Show Hi-Lo Values on Cards", 
                       variable=self.show_hilo_on_cards,
-                      font=('Trebuchet MS', 11), bg=COLORS['bg_primary'],
+                      font=get_font('body'), bg=COLORS['bg_primary'],
                       fg=COLORS['text_primary'], selectcolor=COLORS['bg_elevated'],
                       activebackground=COLORS['bg_primary'],
                       command=self._update_display).pack(side='left')
         
         # Apply button
         apply_btn = tk.Button(self.settings_window, text="✓  APPLY & START NEW GAME",
-                             font=('Trebuchet MS', 13, 'bold'),
+                             font=get_font('button_lg'),
                              bg=COLORS['emerald_dark'], fg='white',
                              relief='flat', cursor='hand2', pady=12,
                              activebackground=COLORS['emerald'],
@@ -675,16 +786,30 @@ class BlackjackGame:
         apply_btn.pack(fill='x', padx=30, pady=20)
         add_hover_effect(apply_btn, COLORS['emerald_dark'], COLORS['emerald'])
         
+    def _on_dealing_speed_change(self, value):
+        """Track the dealing speed in Python and refresh its readout when the percentage changes"""
+        speed = int(float(value))
+        if speed != self._dealing_speed:
+            self._dealing_speed = speed
+            self._set_label(self.dealing_speed_label, f"{speed}%")
+            
+    def _on_ai_skill_change(self, value):
+        """Refresh the AI skill readout - the Scale fires for every pixel dragged"""
+        pct = int(float(value))
+        if pct != self._last_ai_pct:
+            self._last_ai_pct = pct
+            self._set_label(self.ai_skill_label, f"{pct}%")
+            
     def _create_setting_row(self, parent, label, var, min_val, max_val, command=None):
         """Create a settings row with label and spinbox"""
         frame = tk.Frame(parent, bg=COLORS['bg_primary'])
         frame.pack(fill='x', pady=8)
         
-        tk.Label(frame, text=label + ":", font=('Trebuchet MS', 11),
+        tk.Label(frame, text=label + ":", font=get_font('body'),
                 bg=COLORS['bg_primary'], fg=COLORS['text_primary']).pack(side='left')
         
         tk.Spinbox(frame, from_=min_val, to=max_val, textvariable=var,
-                  width=5, font=('Consolas', 11), bg=COLORS['bg_elevated'],
+                  width=5, font=get_font('mono'), bg=COLORS['bg_elevated'],
                   fg=COLORS['text_primary'], command=command).pack(side='right')
         
     def _update_player_config(self):
@@ -697,16 +822,19 @@ class BlackjackGame:
             row = tk.Frame(self.player_config_frame, bg=COLORS['bg_elevated'])
             row.pack(fill='x', padx=15, pady=5)
             
-            tk.Label(row, text=f"Hand {i+1}:", font=('Trebuchet MS', 10),
+            tk.Label(row, text=f"Hand {i+1}:", font=get_font('body_sm'),
                     bg=COLORS['bg_elevated'], fg=COLORS['text_primary']).pack(side='left', pady=8)
             
-            ttk.Combobox(row, textvariable=self.player_types[i],
-                        values=["Human", "AI"], state='readonly', width=12).pack(side='right', pady=8, padx=10)
+            combo = ttk.Combobox(row, values=["Human", "AI"], state='readonly', width=12)
+            combo.set(self.player_types[i])
+            combo.bind('<<ComboboxSelected>>',
+                      lambda e, idx=i: self.player_types.__setitem__(idx, e.widget.get()))
+            combo.pack(side='right', pady=8, padx=10)
             
     def _apply_settings(self):
         """Apply settings and start new game"""
         if self.settings_window:
-            self.settings_window.destroy()
+            self.settings_window.withdraw()
         self._start_new_game()
         
     # ═══════════════════════════════════════════════════════════════
@@ -717,14 +845,14 @@ class BlackjackGame:
         """Toggle between training and test mode"""
         self.training_mode.set(not self.training_mode.get())
         if self.training_mode.get():
-            self.mode_btn.config(text="🎓 TRAINING", bg=COLORS['emerald_dark'])
+            self._configure(self.mode_btn, text="🎓 TRAINING", bg=COLORS['emerald_dark'])
             self.show_running_count.set(True)
             self.show_true_count.set(True)
             self.show_hilo_chart.set(True)
             self.show_discard_tray.set(True)
             self.show_hilo_on_cards.set(True)
         else:
-            self.mode_btn.config(text="📝 TEST MODE", bg=COLORS['danger'])
+            self._configure(self.mode_btn, text="📝 TEST MODE", bg=COLORS['danger'])
             self.show_running_count.set(False)
             self.show_true_count.set(False)
             self.show_hilo_chart.set(False)
@@ -734,26 +862,41 @@ class BlackjackGame:
         self._update_display()
         
     def _update_counting_visibility(self):
+        """Schedule a visibility refresh - repeated toggles collapse into one relayout"""
+        if self.visibility_id is None:
+            self.visibility_id = self.root.after_idle(self._apply_counting_visibility)
+            
+    def _apply_counting_visibility(self):
         """Update visibility of counting aids - always maintain fixed order"""
+        self.visibility_id = None
+        
         # First, unpack all items to reset their order
         self.running_count_frame.pack_forget()
         self.true_count_frame.pack_forget()
         self.hilo_frame.pack_forget()
         self.discard_frame.pack_forget()
         
+        show_running = self.show_running_count.get()
+        show_true = self.show_true_count.get()
+        show_discard = self.show_discard_tray.get()
+        self._aids_shown = (show_running, show_true, show_discard)
+        
         # Then pack them back in the correct fixed order (only if visible)
-        if self.show_running_count.get():
+        if show_running:
             self.running_count_frame.pack(fill='x', padx=10, pady=4)
             
-        if self.show_true_count.get():
+        if show_true:
             self.true_count_frame.pack(fill='x', padx=10, pady=4)
             
         if self.show_hilo_chart.get():
             self.hilo_frame.pack(fill='x', padx=10, pady=4)
             
-        if self.show_discard_tray.get():
+        if show_discard:
             self.discard_frame.pack(fill='x', padx=10, pady=4)
             
+        # Hidden aids are not refreshed while dealing - catch them up now
+        self._update_counting_display()
+            
     # ═══════════════════════════════════════════════════════════════
     # CARD MANAGEMENT
     # ═══════════════════════════════════════════════════════════════
@@ -768,134 +911,243 @@ class BlackjackGame:
         Returns:
             Adjusted delay based on dealing speed (10-100, where 50 = 1.0x)
         """
-        speed = self.dealing_speed.get()
+        speed = self._dealing_speed  # Python copy - this runs for every animation step
         # Speed 50 = 1.0x (normal), 100 = 2.0x (faster), 10 = 0.2x (slower)
         speed_multiplier = speed / 50.0
         adjusted_delay = int(base_delay / speed_multiplier)
         return max(10, adjusted_delay)  # Minimum 10ms delay
     
+    def _configure(self, widget, **options):
+        """
+        Reconfigure a frequently updated widget straight through Tcl.
+        
+        Skips the Tkinter configure() wrapper, which rebuilds its option
+        list on every call - the display path runs on every deal and timer
+        tick. Options equal to the last value written (or None) are dropped,
+        so steady widgets cost no Tcl call at all.
+        """
+        last = self._last_options.get(widget._w)
+        if last is None:
+            last = self._last_options[widget._w] = {}
+        args = []
+        for name, value in options.items():
+            if value is not None and last.get(name) != value:
+                last[name] = value
+                args += ('-' + name, value)
+        if args:
+            self._tk_call(widget._w, 'configure', *args)
+            
+    def _forget_options(self, container):
+        """Drop the _configure cache entries of a container's descendants before they are destroyed"""
+        pending = container.winfo_children()
+        while pending:
+            widget = pending.pop()
+            self._last_options.pop(widget._w, None)
+            pending += widget.winfo_children()
+            
+    def _set_label(self, label, text=None, fg=None):
+        """Set a hot label's text and/or colour (see _configure)"""
+        self._configure(label, text=text, fg=fg)
+        
+    def _record_visible(self, card):
+        """Mark a card as seen and fold it into the running count"""
+        self.visible_cards.append(card)
+        self._running_count += HILO_VALUES[card[0]]
+        
     def _discard_card(self, card, visible=True):
         """Add card to discard pile"""
         self.discarded_cards.append(card)
         if visible:
-            self.visible_cards.append(card)
+            self._record_visible(card)
             
     def _reveal_dealer_hole_card(self):
         """Reveal dealer's hole card for counting"""
-        if self.dealer_hole_card and self.dealer_hole_card not in self.visible_cards:
-            self.visible_cards.append(self.dealer_hole_card)
+        if self.dealer_hole_card:
+            self._record_visible(self.dealer_hole_card)
             self.dealer_hole_card = None
             self._update_counting_display()
             
+    def _cards_remaining(self):
+        """Cards left in the shoe past the deal cursor"""
+        return len(self.deck) - self._deck_cursor
+        
+    def _draw_card(self):
+        """Take the next card from the shoe, reshuffling if it is empty"""
+        if self._deck_cursor >= len(self.deck):
+            self._shuffle_deck()
+        card = self.deck[self._deck_cursor]
+        self._deck_cursor += 1
+        return card
+        
+    def _hand_score(self, hand):
+        """Score of a hand in play, cached when its last card was dealt"""
+        return self._hand_scores.get(id(hand), EMPTY_HAND_SCORE)[0]
+        
+    def _bust_player(self, player):
+        """Mark a player busted, keeping the per-hand bust count in step"""
+        if not player.is_busted:
+            player.is_busted = True
+            self._busted_players += 1
+            
+    def _score_dealt_card(self, hand, card):
+        """Fold a newly dealt card into its hand's cached score without rescoring the hand"""
+        self._hand_scores[id(hand)] = add_card_to_score(
+            self._hand_scores.get(id(hand), EMPTY_HAND_SCORE), card
+        )
+        
     def _deal_card(self, to_hand, visible=True):
         """Deal a card to a hand"""
-        if len(self.deck) == 0:
-            self._shuffle_deck()
-        card = self.deck.pop()
+        card = self._draw_card()
         to_hand.append(card)
+        self._score_dealt_card(to_hand, card)
         self._discard_card(card, visible=visible)
-        self._create_deck_visual()  # Update deck visual
+        self._request_deck_visual()  # Update deck visual
         return card
         
     def _deal_dealer_hole_card(self):
         """Deal dealer's hidden hole card"""
-        if len(self.deck) == 0:
-            self._shuffle_deck()
-        card = self.deck.pop()
+        card = self._draw_card()
         self.dealer_hand.append(card)
+        self._score_dealt_card(self.dealer_hand, card)
         self.dealer_hole_card = card
         self._discard_card(card, visible=False)
-        self._create_deck_visual()
+        self._request_deck_visual()
         return card
         
+    def _take_shoe(self):
+        """
+        Return a freshly shuffled shoe and start shuffling the next one.
+        
+        The next shoe is built on a worker thread while the current one is
+        played, so a reshuffle only swaps lists. The worker never touches Tk.
+        """
+        num_decks = self.num_decks.get()
+        if self._next_shoe and self._next_shoe[0] == num_decks:
+            shoe = self._next_shoe[1].result()
+        else:
+            shoe = create_deck(num_decks)
+        self._next_shoe = (num_decks, self._shuffle_pool.submit(create_deck, num_decks))
+        return shoe
+        
     def _shuffle_deck(self):
         """Reshuffle the deck"""
-        self.deck = create_deck(self.num_decks.get())
+        self.deck = self._take_shoe()
+        self._deck_cursor = 0
         self.discarded_cards = []
         self.visible_cards = []
+        self._running_count = 0
+        self._discard_written_count = None
         self.dealer_hole_card = None
-        self._update_visual_discard_pile()
-        self._create_deck_visual()
-        self.status_label.config(text="🔄 Deck reshuffled!", fg=COLORS['warning'])
+        self._request_discard_pile_visual()
+        self._request_deck_visual()
+        self._set_label(self.status_label, "🔄 Deck reshuffled!", COLORS['warning'])
         
     # ═══════════════════════════════════════════════════════════════
     # DISPLAY UPDATES
     # ═══════════════════════════════════════════════════════════════
     
     def _update_counting_display(self):
-        """Update counting information"""
-        running = calculate_running_count(self.visible_cards)
-        true = calculate_true_count(running, len(self.deck))
-        cards_left = len(self.deck)
+        """Update counting information - aids hidden in test mode are skipped"""
+        show_running, show_true, show_discard = self._aids_shown
+        running = self._running_count
+        cards_left = self._cards_remaining()
         
         # Color code running count
-        if running > 0:
-            rc_color = COLORS['success']
-        elif running < 0:
-            rc_color = COLORS['danger']
-        else:
-            rc_color = COLORS['text_primary']
-            
-        self.running_count_label.config(text=f"{running:+d}" if running != 0 else "0", fg=rc_color)
+        if show_running:
+            if running > 0:
+                rc_color = COLORS['success']
+            elif running < 0:
+                rc_color = COLORS['danger']
+            else:
+                rc_color = COLORS['text_primary']
+                
+            self._set_label(self.running_count_label, f"{running:+d}" if running != 0 else "0", rc_color)
         
         # Color code true count
-        if true > 0:
-            tc_color = COLORS['cyan']
-        elif true < 0:
-            tc_color = COLORS['warning']
-        else:
-            tc_color = COLORS['text_primary']
-            
-        self.true_count_label.config(text=f"{true:+.1f}" if true != 0 else "0.0", fg=tc_color)
+        if show_true:
+            true = calculate_true_count(running, cards_left)
+            if true > 0:
+                tc_color = COLORS['cyan']
+            elif true < 0:
+                tc_color = COLORS['warning']
+            else:
+                tc_color = COLORS['text_primary']
+                
+            self._set_label(self.true_count_label, f"{true:+.1f}" if true != 0 else "0.0", tc_color)
         
-        self.cards_remaining_label.config(text=str(cards_left))
+        self._set_label(self.cards_remaining_label, cards_left)
         
-        # Update deck info
-        total_cards = self.num_decks.get() * 52
-        self.deck_info_label.config(text=f"DECK: {cards_left}/{total_cards}")
+        # Update deck info - the shoe's own size, no Tcl read unless none is dealt yet
+        total_cards = len(self.deck) or self.num_decks.get() * 52
+        self._set_label(self.deck_info_label, f"DECK: {cards_left}/{total_cards}")
         
-        self._update_discard_display()
+        # The tray catches up on every card seen since its last write once shown again
+        if show_discard:
+            self._update_discard_display()
         
-    def _update_discard_display(self):
-        """Update discard tray display"""
-        self.discard_text.config(state='normal')
-        self.discard_text.delete('1.0', tk.END)
+    def _format_discard_row(self, rank, count):
+        """Format one rank row of the discard tray"""
+        prefix, suffix = _DISCARD_ROW_PARTS[rank]
+        return f"{prefix}{count:2d}{suffix}"
         
+    def _rebuild_discard_display(self):
+        """Recount and reformat the whole discard tray (startup and reshuffle)"""
         # Count only visible cards
-        rank_counts = {rank: 0 for rank in RANKS}
+        self._discard_counts = {rank: 0 for rank in RANKS}
         for card in self.visible_cards:
-            rank_counts[card[0]] += 1
-            
-        # Header
-        self.discard_text.insert(tk.END, "  Card │ Seen │ Hi-Lo\n")
-        self.discard_text.insert(tk.END, "  ─────┼──────┼──────\n")
+            self._discard_counts[card[0]] += 1
             
-        for rank in RANKS:
-            count = rank_counts[rank]
-            hilo = HILO_VALUES[rank]
+        self._discard_rows = {rank: self._format_discard_row(rank, self._discard_counts[rank])
+                              for rank in RANKS}
+        self._discard_written_count = len(self.visible_cards)
+        self._write_discard_tray()
+        
+    def _write_discard_tray(self):
+        """Show the header and all rank rows with a single label configure"""
+        rows = self._discard_rows
+        self._configure(self.discard_label,
+                        text=_DISCARD_HEADER + "\n".join([rows[rank] for rank in RANKS]))
+        
+    def _update_discard_display(self):
+        """Update discard tray display - only rows for newly seen cards are reformatted"""
+        if self._discard_written_count is None:
+            self._rebuild_discard_display()
+            return
             
-            if hilo > 0:
-                hilo_str = f"+{hilo}"
-            elif hilo < 0:
-                hilo_str = str(hilo)
-            else:
-                hilo_str = " 0"
-                
-            self.discard_text.insert(tk.END, f"  {rank:>3}  │  {count:2d}  │  {hilo_str}\n")
+        new_cards = self.visible_cards[self._discard_written_count:]
+        if not new_cards:
+            return
             
-        self.discard_text.config(state='disabled')
+        changed_ranks = set()
+        for card in new_cards:
+            self._discard_counts[card[0]] += 1
+            changed_ranks.add(card[0])
+        self._discard_written_count = len(self.visible_cards)
+        
+        for rank in changed_ranks:
+            self._discard_rows[rank] = self._format_discard_row(rank, self._discard_counts[rank])
+        self._write_discard_tray()
         
     def _setup_player_frames(self):
         """Setup player display frames"""
+        self._forget_options(self.players_container)
         for widget in self.players_container.winfo_children():
             widget.destroy()
         self.player_frames = []
         
+        # One equal-width grid column per hand - a single geometry pass for the row
+        for column in range(max(len(self.players), self._player_columns)):
+            self.players_container.columnconfigure(column, weight=0, uniform='')
+        for column in range(len(self.players)):
+            self.players_container.columnconfigure(column, weight=1, uniform='players')
+        self.players_container.rowconfigure(0, weight=1)
+        self._player_columns = len(self.players)
+        
         for i, player in enumerate(self.players):
             # Outer frame for glow effect
             glow_frame = tk.Frame(self.players_container, bg=COLORS['player_frame_normal'], 
                                  relief='flat', bd=0)
-            glow_frame.pack(side='left', fill='both', expand=True, padx=5, pady=5)
+            glow_frame.grid(row=0, column=i, sticky='nsew', padx=5, pady=5)
             
             # Main player frame
             frame = tk.Frame(glow_frame, bg=COLORS['player_frame_normal'], relief='flat')
@@ -903,29 +1155,30 @@ class BlackjackGame:
             
             inner_frame = tk.Frame(frame, bg=COLORS['player_frame_inner'])
             inner_frame.pack(fill='both', expand=True, padx=2, pady=2)
+            inner_frame.columnconfigure(0, weight=1)
             
-            type_icon = "🤖" if player.player_type == PlayerType.AI else "👤"
+            type_icon = "🤖" if player.player_type is PlayerType.AI else "👤"
             header = tk.Label(inner_frame, text=f"{type_icon} {player.name}",
-                            font=('Trebuchet MS', 11, 'bold'),
+                            font=get_font('body_bold'),
                             bg=COLORS['player_frame_inner'], fg=COLORS['gold'])
-            header.pack(pady=(5, 0))
+            header.grid(row=0, column=0, pady=(5, 0))
             
             # Cards frame with FIXED background (isolated from state changes)
             cards_outer = tk.Frame(inner_frame, bg=COLORS['bg_card_table'])
-            cards_outer.pack(pady=8, fill='x', padx=5)
+            cards_outer.grid(row=1, column=0, pady=8, sticky='ew', padx=5)
             
             cards_frame = tk.Frame(cards_outer, bg=COLORS['bg_card_table'])
             cards_frame.pack(expand=True)
             
             score_label = tk.Label(inner_frame, text="Score: 0",
-                                  font=('Trebuchet MS', 11),
+                                  font=get_font('body'),
                                   bg=COLORS['player_frame_inner'], fg=COLORS['text_primary'])
-            score_label.pack()
+            score_label.grid(row=2, column=0)
             
             status_label = tk.Label(inner_frame, text="",
-                                   font=('Trebuchet MS', 9, 'italic'),
+                                   font=get_font('status_italic'),
                                    bg=COLORS['player_frame_inner'], fg=COLORS['text_muted'])
-            status_label.pack(pady=(0, 5))
+            status_label.grid(row=3, column=0, pady=(0, 5))
             
             self.player_frames.append({
                 'glow_frame': glow_frame,
@@ -933,139 +1186,213 @@ class BlackjackGame:
                 'inner_frame': inner_frame,
                 'cards_outer': cards_outer,
                 'cards_frame': cards_frame,
+                'card_row': self._create_card_row(cards_frame, padx=3),
                 'score_label': score_label,
                 'status_label': status_label,
                 'header': header,
                 'player': player
             })
             
+    def _create_card_row(self, frame, padx):
+        """Create the bookkeeping for a row of reusable card canvases"""
+        # Build the canvases for the two-card initial deal up front (unpacked), so the
+        # deal animation only draws and packs them instead of creating widgets mid-sequence
+        widgets = [create_card_canvas(frame) for _ in range(2)]
+        return {
+            'frame': frame,
+            'widgets': widgets,              # Pooled card canvases, in display order
+            'drawn': [None] * len(widgets),  # What each canvas currently shows (card, hidden, show_hilo, training)
+            'shown': 0,                      # How many of them are currently packed
+            'padx': padx
+        }
+        
+    def _sync_card_row(self, row, hand, show_hilo, training_mode, hide_first=False):
+        """Show a hand in its card row, redrawing pooled canvases instead of recreating them"""
+        widgets = row['widgets']
+        drawn = row['drawn']
+        
+        # Grow the pool only when this hand is longer than any shown in the row
+        while len(widgets) < len(hand):
+            widgets.append(create_card_canvas(row['frame']))
+            drawn.append(None)
+            
+        for i, card in enumerate(hand):
+            # Only redraw canvases whose card or display state actually changed
+            state = (card, hide_first and i == 0, show_hilo, training_mode)
+            if drawn[i] != state:
+                update_card_widget(widgets[i], card, hidden=state[1],
+                                   show_hilo=show_hilo, training_mode=training_mode,
+                                   on_hilo_click=self._toggle_hilo_on_cards)
+                drawn[i] = state
+            if i >= row['shown']:
+                widgets[i].pack(side='left', padx=row['padx'])
+                
+        # Hide canvases left over from a longer previous hand
+        for widget in widgets[len(hand):row['shown']]:
+            widget.pack_forget()
+        row['shown'] = len(hand)
+        
     def _toggle_hilo_on_cards(self):
         """Toggle Hi-Lo display on cards when clicked"""
         self.show_hilo_on_cards.set(not self.show_hilo_on_cards.get())
         self._update_display()
     
+    @contextmanager
+    def _batch_updates(self):
+        """
+        Coalesce _update_display calls made inside the block into one on exit.
+        
+        Reentrant - only the outermost block refreshes the display.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._display_dirty:
+                self._display_dirty = False
+                self._update_display()
+                
     def _update_display(self):
         """Update the entire game display"""
-        # Update dealer cards
-        for widget in self.dealer_cards_frame.winfo_children():
-            widget.destroy()
+        if self._batch_depth:
+            self._display_dirty = True
+            return
             
-        for i, card in enumerate(self.dealer_hand):
-            hidden = (i == 0 and not self.game_over)
-            card_widget = create_card_widget(self.dealer_cards_frame, card, hidden=hidden,
-                                            show_hilo=self.show_hilo_on_cards.get(),
-                                            training_mode=self.training_mode.get(),
-                                            on_hilo_click=self._toggle_hilo_on_cards)
-            card_widget.pack(side='left', padx=4)
+        # Read the Tk variables once rather than once per card
+        show_hilo = self.show_hilo_on_cards.get()
+        training = self.training_mode.get()
+        game_over = self.game_over
+        
+        # Update dealer cards
+        self._sync_card_row(self._dealer_card_row, self.dealer_hand, show_hilo, training,
+                            hide_first=not game_over)
             
         # Dealer score
-        if self.game_over:
-            dealer_score = calculate_hand_score(self.dealer_hand)
-            self.dealer_score_label.config(text=f"Score: {dealer_score}")
+        if game_over:
+            dealer_score = self._hand_score(self.dealer_hand)
+            self._set_label(self.dealer_score_label, f"Score: {dealer_score}")
         elif len(self.dealer_hand) > 1:
             visible_score = get_card_value(self.dealer_hand[1])
-            self.dealer_score_label.config(text=f"Showing: {visible_score}")
+            self._set_label(self.dealer_score_label, f"Showing: {visible_score}")
         else:
-            self.dealer_score_label.config(text="")
+            self._set_label(self.dealer_score_label, "")
             
         # Update player frames
         for pf in self.player_frames:
             player = pf['player']
-            cards_frame = pf['cards_frame']
-            
-            for widget in cards_frame.winfo_children():
-                widget.destroy()
-                
-            card_container = tk.Frame(cards_frame, bg=COLORS['bg_card_table'])
-            card_container.pack(expand=True)
-            
-            for card in player.hand:
-                card_widget = create_card_widget(card_container, card,
-                                                show_hilo=self.show_hilo_on_cards.get(),
-                                                training_mode=self.training_mode.get(),
-                                                on_hilo_click=self._toggle_hilo_on_cards)
-                card_widget.pack(side='left', padx=3)
+            self._sync_card_row(pf['card_row'], player.hand, show_hilo, training)
                 
             # Update score
-            score = calculate_hand_score(player.hand)
-            pf['score_label'].config(text=f"Score: {score}")
+            score = self._hand_score(player.hand)
+            self._set_label(pf['score_label'], f"Score: {score}")
             
             # Update status and apply glow effects
             self._apply_player_visual_state(pf, player)
                 
         self._update_counting_display()
+        self._update_action_buttons()
+        
+    def _update_player_status(self, player):
+        """
+        Refresh only a player's status and glow after a flag-only change (e.g. standing).
+        
+        No cards or counts moved, so the full _update_display pass is not needed.
+        """
+        for pf in self.player_frames:
+            if pf['player'] is player:
+                self._apply_player_visual_state(pf, player)
+        self._update_action_buttons()
         
-        # Update button states
+    def _update_action_buttons(self):
+        """Enable the action buttons only on a human player's turn"""
         current_player = self.players[self.current_player_index] if self.current_player_index < len(self.players) else None
-        is_human_turn = current_player and current_player.player_type == PlayerType.HUMAN and not self.game_over
+        is_human_turn = current_player and current_player.player_type is PlayerType.HUMAN and not self.game_over
         
         state = 'normal' if is_human_turn else 'disabled'
-        self.hit_button.config(state=state)
-        self.stand_button.config(state=state)
+        self._configure(self.hit_button, state=state)
+        self._configure(self.stand_button, state=state)
         
         can_double = is_human_turn and current_player and len(current_player.hand) == 2
-        self.double_button.config(state='normal' if can_double else 'disabled')
+        self._configure(self.double_button, state='normal' if can_double else 'disabled')
         
+    def _disable_action_buttons(self):
+        """Disable the action buttons while a human action plays out"""
+        for button in (self.hit_button, self.stand_button, self.double_button):
+            self._configure(button, state='disabled')
+            
     def _apply_player_visual_state(self, pf, player):
         """Apply visual state (glow effects) to a player frame"""
-        glow_frame = pf['glow_frame']
-        frame = pf['frame']
-        inner_frame = pf['inner_frame']
-        header = pf['header']
-        score_label = pf['score_label']
-        status_label = pf['status_label']
-        
-        # Default colors
-        glow_color = COLORS['player_frame_normal']
-        frame_color = COLORS['player_frame_normal']
-        inner_color = COLORS['player_frame_inner']
-        
         if player.is_busted:
-            # BUST - Red glow effect
-            glow_color = COLORS['glow_bust']
-            frame_color = COLORS['glow_bust']
-            inner_color = '#3d2a2a'  # Dark reddish interior
-            status_label.config(text="💥 BUSTED!", fg=COLORS['danger'])
-            
+            state = 'busted'
         elif player.is_winner:
-            # WIN - Gold glow effect
-            glow_color = COLORS['glow_win']
-            frame_color = COLORS['glow_win']
-            inner_color = '#3d3a2a'  # Warm golden interior
-            status_label.config(text="🏆 WINNER!", fg=COLORS['gold'])
-            
+            state = 'winner'
         elif player.is_standing:
-            status_label.config(text="✓ Standing", fg=COLORS['success'])
-            
+            state = 'standing'
         elif self.current_player_index < len(self.players) and \
              self.players[self.current_player_index] == player and not self.game_over:
-            # Active player - subtle green glow
-            glow_color = COLORS['glow_active']
-            frame_color = COLORS['player_frame_active']
-            inner_color = COLORS['player_frame_active']
-            status_label.config(text="► YOUR TURN", fg=COLORS['gold'])
-            
+            state = 'active'
         else:
-            status_label.config(text="", fg=COLORS['text_muted'])
-        
-        # Apply colors
-        glow_frame.config(bg=glow_color)
-        frame.config(bg=frame_color)
-        inner_frame.config(bg=inner_color)
-        header.config(bg=inner_color)
-        score_label.config(bg=inner_color)
-        status_label.config(bg=inner_color)
-        
-        # Cards area ALWAYS stays table green (isolated from state)
-        pf['cards_outer'].config(bg=COLORS['bg_card_table'])
-        pf['cards_frame'].config(bg=COLORS['bg_card_table'])
+            state = 'normal'
+        glow_color, frame_color, inner_color, status_text, status_fg = _PLAYER_FRAME_STYLES[state]
+        
+        # Apply colors - unchanged options are skipped by _configure
+        configure = self._configure
+        configure(pf['glow_frame'], bg=glow_color)
+        configure(pf['frame'], bg=frame_color)
+        configure(pf['inner_frame'], bg=inner_color)
+        configure(pf['header'], bg=inner_color)
+        configure(pf['score_label'], bg=inner_color)
+        configure(pf['status_label'], text=status_text, fg=status_fg, bg=inner_color)
+        # Cards area ALWAYS stays table green (isolated from state) - it is
+        # created with that colour, so it is never reconfigured here
         
     # ═══════════════════════════════════════════════════════════════
     # GAME FLOW
     # ═══════════════════════════════════════════════════════════════
     
+    def _on_window_unmap(self, event):
+        """Main window minimized - stop advancing the game loop"""
+        # Child widgets share the root's bindtag, so ignore their own unmaps
+        if event.widget is self.root and self._window_visible:
+            self._window_visible = False
+            self._hidden_since = time.monotonic()
+            
+    def _on_window_map(self, event):
+        """Main window restored - resume any held game-loop steps"""
+        if event.widget is not self.root or self._window_visible:
+            return
+        self._window_visible = True
+        # The turn timer should not have run down while nobody could see it
+        if self.timer_id:
+            self._timer_deadline += time.monotonic() - self._hidden_since
+        held, self._held_callbacks = self._held_callbacks, []
+        # Keep the restarted steps cancellable, like their normally scheduled calls
+        for callback in held:
+            after_id = self.root.after_idle(callback)
+            if callback == self._update_timer:
+                self.timer_id = after_id
+            else:
+                self._resumed_ids.append(after_id)
+            
+    def _hold_while_hidden(self, callback):
+        """
+        Defer a game-loop step while the window is minimized.
+        
+        Returns:
+            True if the step was held and the caller should return
+        """
+        if self._window_visible:
+            return False
+        self._held_callbacks.append(callback)
+        return True
+        
     def _cancel_all_timers(self):
         """Cancel all active timers"""
+        self._held_callbacks = []
+        for after_id in self._resumed_ids:
+            self.root.after_cancel(after_id)
+        self._resumed_ids = []
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
             self.timer_id = None
@@ -1073,7 +1400,7 @@ class BlackjackGame:
             self.root.after_cancel(self.auto_deal_id)
             self.auto_deal_id = None
         self.is_paused = False
-        self.pause_button.config(text="⏸\nPAUSE", bg=COLORS['bg_elevated'])
+        self._configure(self.pause_button, text="⏸\nPAUSE", bg=COLORS['bg_elevated'])
         self.timer_frame.pack_forget()
         
     def _start_new_game(self):
@@ -1082,9 +1409,12 @@ class BlackjackGame:
         self.animation.cancel_all()
         
         # Full reset
-        self.deck = create_deck(self.num_decks.get())
+        self.deck = self._take_shoe()
+        self._deck_cursor = 0
         self.discarded_cards = []
         self.visible_cards = []
+        self._running_count = 0
+        self._discard_written_count = None
         self.dealer_hole_card = None
         
         # Reset deck position to initial (above dealer header)
@@ -1092,10 +1422,10 @@ class BlackjackGame:
         self.deck_visual_frame.pack(pady=(0, 8))
         
         # Update visuals
-        self._update_visual_discard_pile()
-        self._create_deck_visual()
+        self._request_discard_pile_visual()
+        self._request_deck_visual()
         
-        self.status_label.config(text="🔄 New game started - Fresh deck shuffled!", fg=COLORS['gold'])
+        self._set_label(self.status_label, "🔄 New game started - Fresh deck shuffled!", COLORS['gold'])
         self.root.after(500, self._begin_dealing)
         
     def _deal_new_hand(self):
@@ -1105,44 +1435,58 @@ class BlackjackGame:
         
         self.dealer_hole_card = None
         
-        # Check if reshuffle needed
-        total_cards = self.num_decks.get() * 52
-        if len(self.deck) < total_cards * RESHUFFLE_PENETRATION or not self.deck:
-            self.deck = create_deck(self.num_decks.get())
+        # Check if reshuffle needed - measured against the current shoe's own size
+        total_cards = len(self.deck)
+        if not total_cards or self._cards_remaining() < total_cards * RESHUFFLE_PENETRATION:
+            self.deck = self._take_shoe()
+            self._deck_cursor = 0
             self.discarded_cards = []
             self.visible_cards = []
-            self._update_visual_discard_pile()
-            self._create_deck_visual()
-            self.status_label.config(text="🔀 Deck reshuffled - dealing new hand...", fg=COLORS['warning'])
+            self._running_count = 0
+            self._discard_written_count = None
+            self._request_discard_pile_visual()
+            self._request_deck_visual()
+            self._set_label(self.status_label, "🔀 Deck reshuffled - dealing new hand...", COLORS['warning'])
         else:
-            self.status_label.config(text="🃏 Dealing new hand...", fg=COLORS['success'])
+            self._set_label(self.status_label, "🃏 Dealing new hand...", COLORS['success'])
             
         self.root.after(300, self._begin_dealing)
         
     def _begin_dealing(self):
         """Initialize hands and begin dealing"""
-        self.players = []
         num_players = self.num_players.get()
-        
-        for i in range(num_players):
-            player_type = PlayerType.AI if self.player_types[i].get() == "AI" else PlayerType.HUMAN
-            player = Player(
-                name=f"Hand {i+1}",
-                player_type=player_type,
-                hand=[],
-                ai_skill=self.ai_skill.get()
-            )
-            self.players.append(player)
+        ai_skill = self.ai_skill.get()
+        self._dealing_speed = self.dealing_speed.get()
+        player_config = (num_players, tuple(self.player_types[:num_players]), ai_skill)
+        
+        # Same table as last hand - keep the Player objects and their frames
+        reuse_frames = bool(self.player_frames) and player_config == self._last_player_config
+        if reuse_frames:
+            for player in self.players:
+                player.reset()
+        else:
+            self.players = []
+            for i in range(num_players):
+                player_type = PlayerType.AI if self.player_types[i] == "AI" else PlayerType.HUMAN
+                player = Player(
+                    name=f"Hand {i+1}",
+                    player_type=player_type,
+                    hand=[],
+                    ai_skill=ai_skill
+                )
+                self.players.append(player)
+            self._last_player_config = player_config
             
         self.dealer_hand = []
+        self._hand_scores = {}  # Every hand starts empty again
+        self._busted_players = 0
         self.current_player_index = 0
         self.game_over = False
         self.game_started = True
         
         # Move deck near the discard pile when dealing starts - align with discard pile
         self.deck_visual_frame.pack_forget()
-        # Get exact position of discard pile to align deck perfectly
-        self.table_inner.update_idletasks()
+        # Placement is computed from the fixed layout below, so no geometry pass is needed here
         # Both deck and discard use same dimensions: CARD_WIDTH + (5-1)*2 + 4 = CARD_WIDTH + 12
         max_visible = 5
         stack_offset = 2
@@ -1159,7 +1503,8 @@ class BlackjackGame:
         deck_x = discard_x_relative + discard_pile_width + 15  # Position right next to discard pile with spacing
         self.deck_visual_frame.place(x=deck_x, y=discard_y_relative, anchor='nw')
         
-        self._setup_player_frames()
+        if not reuse_frames:
+            self._setup_player_frames()
         self._update_display()
         
         self.animation.set_animating(True)
@@ -1167,6 +1512,8 @@ class BlackjackGame:
         
     def _animate_deal_sequence(self, round_num, player_idx):
         """Animate dealing cards in sequence"""
+        if self._hold_while_hidden(lambda: self._animate_deal_sequence(round_num, player_idx)):
+            return
         if round_num >= 2:
             self._finish_dealing()
             return
@@ -1186,14 +1533,14 @@ class BlackjackGame:
                     
     def _animate_card_deal(self, target_hand, callback, visible=True):
         """Animate a single card being dealt with arc motion"""
-        self.status_label.config(text="🎴 Dealing...", fg=COLORS['cyan'])
+        self._set_label(self.status_label, "🎴 Dealing...", COLORS['cyan'])
         self._deal_card(target_hand, visible=visible)
         delay = self._get_dealing_delay(ANIMATION_CARD_DEAL)
         self.root.after(delay, lambda: self._card_dealt_effect(callback))
         
     def _animate_dealer_hole_card(self, callback):
         """Animate dealing dealer's hidden hole card"""
-        self.status_label.config(text="🎴 Dealing...", fg=COLORS['cyan'])
+        self._set_label(self.status_label, "🎴 Dealing...", COLORS['cyan'])
         self._deal_dealer_hole_card()
         delay = self._get_dealing_delay(ANIMATION_CARD_DEAL)
         self.root.after(delay, lambda: self._card_dealt_effect(callback))
@@ -1206,41 +1553,47 @@ class BlackjackGame:
         
     def _finish_dealing(self):
         """Complete dealing and start play"""
-        self.animation.set_animating(False)
-        self._update_display()
-        
-        # Check for dealer blackjack
-        if calculate_hand_score(self.dealer_hand) == 21:
-            self.game_over = True
-            self._animate_dealer_reveal(self._handle_dealer_blackjack)
-            return
+        with self._batch_updates():
+            self.animation.set_animating(False)
+            self._update_display()
             
-        # Check for player blackjacks
-        for player in self.players:
-            if calculate_hand_score(player.hand) == 21:
-                player.is_standing = True
+            # Check for dealer blackjack
+            if self._hand_score(self.dealer_hand) == 21:
+                self.game_over = True
+                self._animate_dealer_reveal(self._handle_dealer_blackjack)
+                return
                 
-        self._find_next_active_player()
-        self._update_display()
-        self.status_label.config(text="♠ ♥ Cards dealt - Good luck! ♦ ♣", fg=COLORS['success'])
-        self._start_player_turn()
+            # Check for player blackjacks
+            for player in self.players:
+                if self._hand_score(player.hand) == 21:
+                    player.is_standing = True
+                    
+            self._find_next_active_player()
+            self._update_display()
+            self._set_label(self.status_label, "♠ ♥ Cards dealt - Good luck! ♦ ♣", COLORS['success'])
+            self._start_player_turn()
         
     def _handle_dealer_blackjack(self):
         """Handle dealer blackjack"""
-        self.status_label.config(text="♠ Dealer has Blackjack! ♠", fg=COLORS['danger'])
+        self._set_label(self.status_label, "♠ Dealer has Blackjack! ♠", COLORS['danger'])
         self._update_display()
         self._schedule_auto_deal()
         
     def _animate_dealer_reveal(self, callback):
         """Animate dealer hole card reveal"""
-        self.status_label.config(text="🔄 Dealer reveals hole card...", fg=COLORS['warning'])
+        self._set_label(self.status_label, "🔄 Dealer reveals hole card...", COLORS['warning'])
         self.root.after(300, lambda: self._dealer_card_flip_step(0, callback))
         
     def _dealer_card_flip_step(self, step, callback):
-        """Animated card flip steps"""
+        """Animated card flip steps - the table is redrawn when the flip starts and at the reveal"""
+        if self._hold_while_hidden(lambda: self._dealer_card_flip_step(step, callback)):
+            return
         if step < 3:
-            self._update_display()
-            self.root.after(ANIMATION_FLIP_STEP, lambda: self._dealer_card_flip_step(step + 1, callback))
+            if step == 0:
+                # Show the hand ending (hole card face, dealer score, disabled buttons) right away
+                self._update_display()
+            # Nothing changes between flip steps, so wait them out in a single timer
+            self.root.after((3 - step) * ANIMATION_FLIP_STEP, lambda: self._dealer_card_flip_step(3, callback))
         else:
             self._reveal_dealer_hole_card()
             self._update_display()
@@ -1263,41 +1616,48 @@ class BlackjackGame:
             
         player = self.players[self.current_player_index]
         
-        if player.player_type == PlayerType.AI:
+        if player.player_type is PlayerType.AI:
             self.root.after(500, self._ai_play)
         else:
             if self.timer_enabled.get():
                 self._start_timer()
-            self.status_label.config(text=f"♠ {player.name}'s turn - Hit or Stand? ♠", fg=COLORS['gold'])
+            self._set_label(self.status_label, f"♠ {player.name}'s turn - Hit or Stand? ♠", COLORS['gold'])
             
     def _start_timer(self):
         """Start turn timer"""
-        self.time_remaining = self.timer_duration.get()
+        duration = self.timer_duration.get()
+        self._timer_total = max(1, duration)
+        self._timer_deadline = time.monotonic() + duration
+        self.time_remaining = None
         self.timer_frame.pack(fill='x', padx=30, pady=(10, 0))
-        self.timer_bar['maximum'] = self.timer_duration.get()
-        self.timer_bar['value'] = self.time_remaining
         self._update_timer()
         
     def _update_timer(self):
-        """Update timer countdown"""
+        """Update timer countdown against a wall-clock deadline so late ticks do not drift"""
         if self.game_over or self.is_paused:
             return
+        if self._hold_while_hidden(self._update_timer):
+            return
             
-        self.timer_bar['value'] = self.time_remaining
-        self.timer_label.config(text=f"⏱ {self.time_remaining}s")
+        seconds_left = self._timer_deadline - time.monotonic()
+        remaining = max(0, math.ceil(seconds_left))
         
-        if self.time_remaining <= 5:
-            self.timer_label.config(fg=COLORS['danger'])
-        else:
-            self.timer_label.config(fg=COLORS['gold'])
+        # Only touch the bar and label when the whole-second value changes
+        if remaining != self.time_remaining:
+            self.time_remaining = remaining
+            self._tk_call(self.timer_bar._w, 'coords', self._timer_fill,
+                          0, 0, 500 * remaining / self._timer_total, 14)
+            timer_color = COLORS['danger'] if remaining <= 5 else COLORS['gold']
+            self._set_label(self.timer_label, f"⏱ {remaining}s", timer_color)
             
-        if self.time_remaining <= 0:
+        if remaining <= 0:
             self.timer_frame.pack_forget()
             self._player_stand()
             return
             
-        self.time_remaining -= 1
-        self.timer_id = self.root.after(1000, self._update_timer)
+        # Wake up right as the display drops to the next whole second
+        delay = max(1, int((seconds_left - (remaining - 1)) * 1000))
+        self.timer_id = self.root.after(delay, self._update_timer)
         
     # ═══════════════════════════════════════════════════════════════
     # PLAYER ACTIONS
@@ -1309,7 +1669,7 @@ class BlackjackGame:
             return
             
         player = self.players[self.current_player_index]
-        if player.player_type != PlayerType.HUMAN:
+        if player.player_type is not PlayerType.HUMAN:
             return
             
         if self.timer_id:
@@ -1318,32 +1678,30 @@ class BlackjackGame:
         self.timer_frame.pack_forget()
         
         # Disable buttons during animation
-        self.hit_button.config(state='disabled')
-        self.stand_button.config(state='disabled')
-        self.double_button.config(state='disabled')
+        self._disable_action_buttons()
         
         self._execute_hit(player)
         self.root.after(ANIMATION_NEXT_PLAYER, lambda: self._after_player_hit(player))
         
     def _execute_hit(self, player):
         """Execute hit action"""
-        self.status_label.config(text="🎴 Hit!", fg=COLORS['cyan'])
+        self._set_label(self.status_label, "🎴 Hit!", COLORS['cyan'])
         self._deal_card(player.hand)
         self._update_display()
         self.root.after(ANIMATION_CARD_EFFECT, lambda: self._check_hit_result(player))
         
     def _check_hit_result(self, player):
         """Check hit result"""
-        score = calculate_hand_score(player.hand)
+        score = self._hand_score(player.hand)
         
         if score > 21:
-            player.is_busted = True
-            self.status_label.config(text=f"💥 {player.name} busted with {score}!", fg=COLORS['danger'])
+            self._bust_player(player)
+            self._set_label(self.status_label, f"💥 {player.name} busted with {score}!", COLORS['danger'])
         elif score == 21:
             player.is_standing = True
-            self.status_label.config(text=f"🎯 {player.name} has 21!", fg=COLORS['success'])
+            self._set_label(self.status_label, f"🎯 {player.name} has 21!", COLORS['success'])
         else:
-            self.status_label.config(text=f"📊 {player.name} has {score}", fg=COLORS['text_primary'])
+            self._set_label(self.status_label, f"📊 {player.name} has {score}", COLORS['text_primary'])
             
         self._update_display()
         
@@ -1362,7 +1720,7 @@ class BlackjackGame:
             return
             
         player = self.players[self.current_player_index]
-        if player.player_type != PlayerType.HUMAN:
+        if player.player_type is not PlayerType.HUMAN:
             return
             
         if self.timer_id:
@@ -1370,9 +1728,9 @@ class BlackjackGame:
             self.timer_id = None
         self.timer_frame.pack_forget()
         
-        self.status_label.config(text=f"✋ {player.name} stands", fg=COLORS['info'])
+        self._set_label(self.status_label, f"✋ {player.name} stands", COLORS['info'])
         player.is_standing = True
-        self._update_display()
+        self._update_player_status(player)
         
         self.root.after(ANIMATION_PLAYER_ACTION, self._next_player)
         
@@ -1382,7 +1740,7 @@ class BlackjackGame:
             return
             
         player = self.players[self.current_player_index]
-        if player.player_type != PlayerType.HUMAN or len(player.hand) != 2:
+        if player.player_type is not PlayerType.HUMAN or len(player.hand) != 2:
             return
             
         if self.timer_id:
@@ -1390,16 +1748,14 @@ class BlackjackGame:
             self.timer_id = None
         self.timer_frame.pack_forget()
         
-        self.hit_button.config(state='disabled')
-        self.stand_button.config(state='disabled')
-        self.double_button.config(state='disabled')
+        self._disable_action_buttons()
         
         self._execute_double(player)
         self.root.after(500, self._next_player)
         
     def _execute_double(self, player):
         """Execute double action"""
-        self.status_label.config(text="💰 Double Down!", fg=COLORS['gold'])
+        self._set_label(self.status_label, "💰 Double Down!", COLORS['gold'])
         self._deal_card(player.hand)
         player.is_standing = True
         self._update_display()
@@ -1407,13 +1763,13 @@ class BlackjackGame:
         
     def _check_double_result(self, player):
         """Check double result"""
-        score = calculate_hand_score(player.hand)
+        score = self._hand_score(player.hand)
         
         if score > 21:
-            player.is_busted = True
-            self.status_label.config(text=f"💥 {player.name} doubled and busted!", fg=COLORS['danger'])
+            self._bust_player(player)
+            self._set_label(self.status_label, f"💥 {player.name} doubled and busted!", COLORS['danger'])
         else:
-            self.status_label.config(text=f"✨ {player.name} doubled down to {score}!", fg=COLORS['gold'])
+            self._set_label(self.status_label, f"✨ {player.name} doubled down to {score}!", COLORS['gold'])
             
         self._update_display()
         
@@ -1435,14 +1791,16 @@ class BlackjackGame:
         """AI player makes decision"""
         if self.game_over or self.is_paused:
             return
+        if self._hold_while_hidden(self._ai_play):
+            return
             
         player = self.players[self.current_player_index]
-        if player.player_type != PlayerType.AI:
+        if player.player_type is not PlayerType.AI:
             return
             
-        self.status_label.config(text=f"🤖 {player.name} is thinking...", fg=COLORS['cyan'])
+        self._set_label(self.status_label, f"🤖 {player.name} is thinking...", COLORS['cyan'])
         
-        hand_score = calculate_hand_score(player.hand)
+        hand_score = self._hand_score(player.hand)
         dealer_upcard = get_card_value(self.dealer_hand[1]) if len(self.dealer_hand) > 1 else 10
         decision = get_ai_decision(hand_score, dealer_upcard, len(player.hand), player.ai_skill)
         
@@ -1455,19 +1813,19 @@ class BlackjackGame:
             
     def _ai_execute_hit(self, player):
         """AI executes hit"""
-        self.status_label.config(text=f"🤖 {player.name} hits!", fg=COLORS['info'])
+        self._set_label(self.status_label, f"🤖 {player.name} hits!", COLORS['info'])
         self._deal_card(player.hand)
         self._update_display()
         
-        score = calculate_hand_score(player.hand)
+        score = self._hand_score(player.hand)
         
         def check_result():
             if score > 21:
-                player.is_busted = True
-                self.status_label.config(text=f"💥 {player.name} busted!", fg=COLORS['danger'])
+                self._bust_player(player)
+                self._set_label(self.status_label, f"💥 {player.name} busted!", COLORS['danger'])
             elif score == 21:
                 player.is_standing = True
-                self.status_label.config(text=f"🎯 {player.name} has 21!", fg=COLORS['success'])
+                self._set_label(self.status_label, f"🎯 {player.name} has 21!", COLORS['success'])
             self._update_display()
             
             if not player.is_busted and not player.is_standing:
@@ -1479,19 +1837,19 @@ class BlackjackGame:
         
     def _ai_execute_double(self, player):
         """AI executes double"""
-        self.status_label.config(text=f"🤖 {player.name} doubles down!", fg=COLORS['gold'])
+        self._set_label(self.status_label, f"🤖 {player.name} doubles down!", COLORS['gold'])
         self._deal_card(player.hand)
         player.is_standing = True
         self._update_display()
         
-        score = calculate_hand_score(player.hand)
+        score = self._hand_score(player.hand)
         
         def check_result():
             if score > 21:
-                player.is_busted = True
-                self.status_label.config(text=f"💥 {player.name} doubled and busted!", fg=COLORS['danger'])
+                self._bust_player(player)
+                self._set_label(self.status_label, f"💥 {player.name} doubled and busted!", COLORS['danger'])
             else:
-                self.status_label.config(text=f"✨ {player.name} doubled to {score}!", fg=COLORS['gold'])
+                self._set_label(self.status_label, f"✨ {player.name} doubled to {score}!", COLORS['gold'])
             self._update_display()
             self.root.after(ANIMATION_NEXT_PLAYER, self._next_player)
             
@@ -1499,9 +1857,9 @@ class BlackjackGame:
         
     def _ai_stand(self, player):
         """AI stands"""
-        self.status_label.config(text=f"🤖 {player.name} stands", fg=COLORS['info'])
+        self._set_label(self.status_label, f"🤖 {player.name} stands", COLORS['info'])
         player.is_standing = True
-        self._update_display()
+        self._update_player_status(player)
         self.root.after(ANIMATION_PLAYER_ACTION, self._next_player)
         
     # ═══════════════════════════════════════════════════════════════
@@ -1511,31 +1869,34 @@ class BlackjackGame:
     def _dealer_play(self):
         """Dealer plays hand"""
         self.game_over = True
-        all_busted = all(p.is_busted for p in self.players)
+        all_busted = self._busted_players == len(self.players)
         self._animate_dealer_reveal(lambda: self._dealer_draw_sequence(all_busted))
         
     def _dealer_draw_sequence(self, all_busted):
         """Dealer draws cards"""
-        if not all_busted and calculate_hand_score(self.dealer_hand) < 17:
-            self.status_label.config(text="🎴 Dealer draws...", fg=COLORS['cyan'])
+        if self._hold_while_hidden(lambda: self._dealer_draw_sequence(all_busted)):
+            return
+        if not all_busted and self._hand_score(self.dealer_hand) < 17:
+            self._set_label(self.status_label, "🎴 Dealer draws...", COLORS['cyan'])
             self._deal_card(self.dealer_hand)
             self._update_display()
             delay = self._get_dealing_delay(ANIMATION_DEALER_DRAW)
             self.root.after(delay, lambda: self._dealer_draw_sequence(all_busted))
         else:
-            self._update_display()
-            self._determine_winners()
-            self._schedule_auto_deal()
+            with self._batch_updates():
+                self._update_display()
+                self._determine_winners()
+                self._schedule_auto_deal()
             
     def _determine_winners(self):
         """Determine winners and apply win glow effects"""
-        dealer_score = calculate_hand_score(self.dealer_hand)
+        dealer_score = self._hand_score(self.dealer_hand)
         dealer_busted = dealer_score > 21
         
         results = []
         
         for player in self.players:
-            player_score = calculate_hand_score(player.hand)
+            player_score = self._hand_score(player.hand)
             
             if player.is_busted:
                 results.append(f"{player.name}: LOST 💔")
@@ -1553,8 +1914,8 @@ class BlackjackGame:
         # Update display to show win/bust glow effects
         self._update_display()
         # Update visual discard pile at end of round
-        self._update_visual_discard_pile()
-        self.status_label.config(text=" │ ".join(results), fg=COLORS['gold'])
+        self._request_discard_pile_visual()
+        self._set_label(self.status_label, " │ ".join(results), COLORS['gold'])
         
     def _schedule_auto_deal(self):
         """Schedule auto-deal"""
@@ -1567,12 +1928,12 @@ class BlackjackGame:
         self.is_paused = not self.is_paused
         
         if self.is_paused:
-            self.pause_button.config(text="▶\nRESUME", bg=COLORS['danger'])
+            self._configure(self.pause_button, text="▶\nRESUME", bg=COLORS['danger'])
             if self.auto_deal_id:
                 self.root.after_cancel(self.auto_deal_id)
                 self.auto_deal_id = None
         else:
-            self.pause_button.config(text="⏸\nPAUSE", bg=COLORS['bg_elevated'])
+            self._configure(self.pause_button, text="⏸\nPAUSE", bg=COLORS['bg_elevated'])
             if self.game_over and self.auto_deal_enabled.get():
                 self._schedule_auto_deal()
             elif not self.game_over:
@@ -58,6 +58,56 @@ COLORS = {
     'player_frame_inner': '#324540',     # Inner frame color
 }
 
+# ═══════════════════════════════════════════════════════════════
+# FONTS
+# ═══════════════════════════════════════════════════════════════
+# Shared font tuples so widgets reuse one spec instead of building a new one
+FONTS = {
+    # Trebuchet MS - general interface text
+    'caption': ('Trebuchet MS', 7),
+    'label': ('Trebuchet MS', 8),
+    'label_bold': ('Trebuchet MS', 8, 'bold'),
+    'button_sm': ('Trebuchet MS', 9, 'bold'),
+    'status_italic': ('Trebuchet MS', 9, 'italic'),
+    'body_sm': ('Trebuchet MS', 10),
+    'button': ('Trebuchet MS', 10, 'bold'),
+    'body': ('Trebuchet MS', 11),
+    'body_bold': ('Trebuchet MS', 11, 'bold'),
+    'button_lg': ('Trebuchet MS', 13, 'bold'),
+    
+    # Palatino Linotype - titles and club styling
+    'status': ('Palatino Linotype', 11),
+    'heading': ('Palatino Linotype', 14, 'bold'),
+    'dialog_title': ('Palatino Linotype', 18, 'bold'),
+    'title': ('Palatino Linotype', 20, 'bold'),
+    
+    # Decorations
+    'ornament': ('Times New Roman', 16),
+    'rule': ('Arial', 12),
+    'arrow': ('Arial', 8),
+    
+    # Consolas - numbers and tables
+    'mono_xs': ('Consolas', 8),
+    'mono_sm': ('Consolas', 9),
+    'mono_sm_bold': ('Consolas', 9, 'bold'),
+    'mono_badge': ('Consolas', 10, 'bold'),
+    'mono': ('Consolas', 11),
+    'mono_bold': ('Consolas', 11, 'bold'),
+    'mono_md_bold': ('Consolas', 12, 'bold'),
+    'mono_lg_bold': ('Consolas', 16, 'bold'),
+    'mono_xl_bold': ('Consolas', 24, 'bold'),
+    
+    # Card faces - scaled for the card size
+    'card_corner_suit': ('Arial', 10),
+    'card_rank_10': ('Arial', 11, 'bold'),
+    'card_rank': ('Arial', 13, 'bold'),
+    'card_pip': ('Arial', 13),
+    'card_face_suit': ('Arial', 16),
+    'card_face_rank': ('Georgia', 20, 'bold'),
+    'card_pip_large': ('Arial', 28),
+    'card_hilo': ('Consolas', 11, 'bold'),
+}
+
 # ═══════════════════════════════════════════════════════════════
 # GAME DEFAULTS
 # ═══════════════════════════════════════════════════════════════
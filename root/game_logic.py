@@ -3,31 +3,35 @@ Core game logic for Blackjack - dealing, scoring, AI decisions
 """
 
 import random
+from itertools import product
 from typing import List, Tuple
 
 from config import SUITS, RANKS, HILO_VALUES
 
 
-def create_deck(num_decks: int = 1) -> List[Tuple[str, str]]:
-    """Create a shuffled shoe with the specified number of decks"""
-    deck = []
-    for _ in range(num_decks):
-        for suit in SUITS:
-            for rank in RANKS:
-                deck.append((rank, suit))
+# One deck's worth of card tuples, built once and shared by every shoe
+_ONE_DECK = tuple(product(RANKS, SUITS))
+
+
+def create_deck(num_decks: int = 1) -> Tuple[Tuple[str, str], ...]:
+    """Create a shuffled shoe with the specified number of decks (read-only, dealt by index)"""
+    deck = list(_ONE_DECK) * num_decks
     random.shuffle(deck)
-    return deck
+    return tuple(deck)
+
+
+# Blackjack value of each rank, with aces counted high
+_CARD_VALUES = {
+    rank: 10 if rank in ('J', 'Q', 'K') else 11 if rank == 'A' else int(rank)
+    for rank in RANKS
+}
+# Same values with aces counted low, for hard totals
+_HARD_VALUES = dict(_CARD_VALUES, A=1)
 
 
 def get_card_value(card: Tuple[str, str]) -> int:
     """Get the blackjack value of a card"""
-    rank = card[0]
-    if rank in ['J', 'Q', 'K']:
-        return 10
-    elif rank == 'A':
-        return 11
-    else:
-        return int(rank)
+    return _CARD_VALUES[card[0]]
 
 
 def get_hilo_value(card: Tuple[str, str]) -> int:
@@ -35,31 +39,42 @@ def get_hilo_value(card: Tuple[str, str]) -> int:
     return HILO_VALUES[card[0]]
 
 
+# Score of an empty hand as (score, hard total, has ace)
+EMPTY_HAND_SCORE = (0, 0, False)
+
+
+def add_card_to_score(hand_score: Tuple[int, int, bool], card: Tuple[str, str]) -> Tuple[int, int, bool]:
+    """
+    Fold one more card into a hand's score without rescoring the whole hand.
+    
+    Args:
+        hand_score: (score, hard total, has ace) of the hand so far
+        card: Tuple of (rank, suit) being added
+        
+    Returns:
+        (score, hard total, has ace) including the new card
+    """
+    _, hard_total, has_ace = hand_score
+    rank = card[0]
+    # Count every ace as 1 - at most one of them can ever be worth 11
+    hard_total += _HARD_VALUES[rank]
+    has_ace = has_ace or rank == 'A'
+    score = hard_total + 10 if has_ace and hard_total <= 11 else hard_total
+    return (score, hard_total, has_ace)
+
+
 def calculate_hand_score(hand: List[Tuple[str, str]]) -> int:
     """Calculate the score of a hand, handling aces properly"""
-    score = 0
-    aces = 0
-    
+    hand_score = EMPTY_HAND_SCORE
     for card in hand:
-        value = get_card_value(card)
-        if card[0] == 'A':
-            aces += 1
-        score += value
-        
-    # Reduce aces from 11 to 1 as needed
-    while score > 21 and aces > 0:
-        score -= 10
-        aces -= 1
-        
-    return score
+        hand_score = add_card_to_score(hand_score, card)
+    return hand_score[0]
 
 
 def calculate_running_count(visible_cards: List[Tuple[str, str]]) -> int:
     """Calculate running count from visible cards only"""
-    count = 0
-    for card in visible_cards:
-        count += get_hilo_value(card)
-    return count
+    # Single sum over the Hi-Lo table - no per-card function call
+    return sum([HILO_VALUES[rank] for rank, _ in visible_cards])
 
 
 def calculate_true_count(running_count: int, cards_remaining: int) -> float:
@@ -90,13 +105,25 @@ def get_basic_strategy_decision(hand_score: int, dealer_upcard: int, num_cards:
         return 'hit'
 
 
+# Basic strategy only depends on the total, the dealer upcard and whether the
+# hand can still double, so evaluate it once for every combination
+_STRATEGY_TABLE = {
+    (score, upcard, can_double): get_basic_strategy_decision(score, upcard, 2 if can_double else 3)
+    for score in range(2, 32)
+    for upcard in range(2, 12)
+    for can_double in (False, True)
+}
+
+
 def get_ai_decision(hand_score: int, dealer_upcard: int, num_cards: int, ai_skill: int) -> str:
     """
     Get AI decision based on basic strategy with skill variance.
     
     ai_skill: 0-100, where 100 = perfect basic strategy
     """
-    optimal = get_basic_strategy_decision(hand_score, dealer_upcard, num_cards)
+    optimal = _STRATEGY_TABLE.get((hand_score, dealer_upcard, num_cards == 2))
+    if optimal is None:
+        optimal = get_basic_strategy_decision(hand_score, dealer_upcard, num_cards)
     
     # Apply skill variance - lower skill means more random mistakes
     if random.randint(1, 100) > ai_skill:
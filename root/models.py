@@ -11,12 +11,16 @@ from config import ANIMATION_ARC_DURATION, ANIMATION_ARC_STEPS, ANIMATION_ARC_HE
 
 
 class PlayerType(Enum):
-    """Type of player - human or AI controlled"""
+    """
+    Type of player - human or AI controlled.
+    
+    Members are singletons, so compare them with `is` rather than ==.
+    """
     HUMAN = "Human"
     AI = "AI"
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Represents a player hand at the table"""
     name: str
@@ -38,6 +42,8 @@ class Player:
 class ArcAnimation:
     """Handles arc path calculations for card dealing animations"""
     
+    __slots__ = ('start_x', 'start_y', 'end_x', 'end_y', 'arc_height')
+    
     def __init__(self, start_x: float, start_y: float, end_x: float, end_y: float,
                  arc_height: float = ANIMATION_ARC_HEIGHT):
         """
@@ -215,15 +221,16 @@ class AnimationManager:
 class DeckPosition:
     """Tracks the deck position for animation origins"""
     
+    __slots__ = ('pos',)
+    
     def __init__(self, x: int = 50, y: int = 80):
-        self.x = x
-        self.y = y
+        # Kept as one tuple so every animation start shares the same object
+        self.pos = (x, y)
         
     def get_position(self) -> Tuple[int, int]:
         """Get the current deck position"""
-        return (self.x, self.y)
+        return self.pos
         
     def set_position(self, x: int, y: int):
         """Update deck position"""
-        self.x = x
-        self.y = y
+        self.pos = (x, y)
@@ -4,15 +4,17 @@ UI component creation helpers for the Blackjack game
 
 import tkinter as tk
 from tkinter import ttk
-import math
+from tkinter import font as tkfont
+from functools import lru_cache
 
 from config import (
-    COLORS, SUIT_SYMBOLS, HILO_VALUES,
+    COLORS, FONTS, SUIT_SYMBOLS, RANKS, SUITS,
     CARD_WIDTH, CARD_HEIGHT, CARD_CORNER_RADIUS
 )
 from game_logic import get_hilo_value
 
 
+@lru_cache(maxsize=64)
 def lighten_color(hex_color: str, factor: float = 1.2) -> str:
     """Lighten a hex color by a factor"""
     hex_color = hex_color.lstrip('#')
@@ -23,6 +25,7 @@ def lighten_color(hex_color: str, factor: float = 1.2) -> str:
     return f'#{r:02x}{g:02x}{b:02x}'
 
 
+@lru_cache(maxsize=64)
 def darken_color(hex_color: str, factor: float = 0.8) -> str:
     """Darken a hex color by a factor"""
     hex_color = hex_color.lstrip('#')
@@ -33,45 +36,112 @@ def darken_color(hex_color: str, factor: float = 0.8) -> str:
     return f'#{r:02x}{g:02x}{b:02x}'
 
 
+# Bind tag shared by every hover button; its handlers are registered once
+_HOVER_TAG = 'HoverButton'
+_HOVER_BOUND = False
+
+
+def _on_hover_enter(e):
+    """Switch a hover button to its hover color"""
+    widget = e.widget
+    if widget['state'] != 'disabled':
+        widget.configure(bg=widget.hover_color)
+
+
+def _on_hover_leave(e):
+    """Restore a hover button's normal color"""
+    widget = e.widget
+    if widget['state'] != 'disabled':
+        widget.configure(bg=widget.normal_color)
+
+
 def add_hover_effect(widget, normal_color: str, hover_color: str):
     """Add hover effect to a button widget"""
-    def on_enter(e):
-        if widget['state'] != 'disabled':
-            widget.configure(bg=hover_color)
-    def on_leave(e):
-        if widget['state'] != 'disabled':
-            widget.configure(bg=normal_color)
-    widget.bind('<Enter>', on_enter)
-    widget.bind('<Leave>', on_leave)
+    global _HOVER_BOUND
+    if not _HOVER_BOUND:
+        widget.bind_class(_HOVER_TAG, '<Enter>', _on_hover_enter)
+        widget.bind_class(_HOVER_TAG, '<Leave>', _on_hover_leave)
+        _HOVER_BOUND = True
+    widget.normal_color = normal_color
+    widget.hover_color = hover_color
+    # Class handlers run right after the widget's own bindings, as before
+    tags = widget.bindtags()
+    if _HOVER_TAG not in tags:
+        widget.bindtags(tags[:1] + (_HOVER_TAG,) + tags[1:])
 
 
-def create_rounded_rect(canvas, x1, y1, x2, y2, radius, **kwargs):
-    """Draw a rounded rectangle on a canvas"""
-    points = [
-        x1 + radius, y1,
-        x2 - radius, y1,
-        x2, y1,
-        x2, y1 + radius,
-        x2, y2 - radius,
-        x2, y2,
-        x2 - radius, y2,
-        x1 + radius, y2,
-        x1, y2,
-        x1, y2 - radius,
-        x1, y1 + radius,
-        x1, y1,
-        x1 + radius, y1
-    ]
-    return canvas.create_polygon(points, smooth=True, **kwargs)
-
-
-def create_card_back_canvas(parent, width=CARD_WIDTH, height=CARD_HEIGHT):
+# Points sampled along each rounded corner (plus its end point)
+_ROUNDED_CORNER_STEPS = 5
+
+
+@lru_cache(maxsize=16)
+def _rounded_corner_offsets(radius):
+    """
+    Tessellate the four corners of a rounded rectangle for one radius.
+    
+    Follows the curve Tk's smooth=True spline drew for the old corner points: a
+    quadratic from half the radius along one edge to half the radius along the
+    next, with the corner itself as control point - so the outline looks unchanged.
+    
+    Returns:
+        Tuple of (corner, dx, dy) offsets, clockwise from the top-right corner -
+        corner indexes (x2, y1), (x2, y2), (x1, y2), (x1, y1)
+    """
+    reach = radius / 2
+    offsets = []
+    for corner in range(4):
+        for i in range(_ROUNDED_CORNER_STEPS + 1):
+            t = i / _ROUNDED_CORNER_STEPS
+            a = reach * (1 - t) ** 2
+            b = reach * t * t
+            offsets.append((corner, *((-a, b), (-b, -a), (a, -b), (b, a))[corner]))
+    return tuple(offsets)
+
+
+@lru_cache(maxsize=32)
+def _rounded_rect_points(x1, y1, x2, y2, radius):
     """
-    Create an elegant card back with diamond pattern using Canvas.
+    Build the flat polygon coordinates of a rounded rectangle.
+    
+    Card shapes are drawn at the same few fixed coordinates, so each
+    outline is computed once and reused.
     
     Returns:
-        Canvas widget representing card back
+        Tuple of x, y coordinates, clockwise from the top-right corner
     """
+    corners = ((x2, y1), (x2, y2), (x1, y2), (x1, y1))
+    points = []
+    for corner, dx, dy in _rounded_corner_offsets(radius):
+        cx, cy = corners[corner]
+        points += (cx + dx, cy + dy)
+    return tuple(points)
+
+
+def create_rounded_rect(canvas, x1, y1, x2, y2, radius, **kwargs):
+    """Draw a rounded rectangle on a canvas"""
+    # Pre-tessellated corners, so Tk draws a plain polygon instead of smoothing a spline
+    return canvas.create_polygon(_rounded_rect_points(x1, y1, x2, y2, radius), **kwargs)
+
+
+def _on_hilo_press(e):
+    """Forward a click on a card's Hi-Lo badge to the callback stored on its canvas"""
+    if e.widget.on_hilo_click:
+        e.widget.on_hilo_click()
+
+
+def _on_hilo_enter(e):
+    """Show the hand cursor over a clickable Hi-Lo badge"""
+    if e.widget.on_hilo_click:
+        e.widget.config(cursor='hand2')
+
+
+def _on_hilo_leave(e):
+    """Restore the cursor when leaving the Hi-Lo badge"""
+    e.widget.config(cursor='')
+
+
+def create_card_canvas(parent, width=CARD_WIDTH, height=CARD_HEIGHT):
+    """Create an empty table-colored canvas sized for a card"""
     canvas = tk.Canvas(
         parent, 
         width=width, 
@@ -79,130 +149,206 @@ def create_card_back_canvas(parent, width=CARD_WIDTH, height=CARD_HEIGHT):
         bg=COLORS['bg_card_table'],
         highlightthickness=0
     )
+    # Badge handlers are bound once per canvas: every tag_bind registers a Tcl
+    # command that is only freed when the canvas is destroyed, and card canvases
+    # are redrawn in place for the whole session
+    canvas.on_hilo_click = None
+    for tag in ('hilo_click', 'hilo_badge'):
+        canvas.tag_bind(tag, '<Button-1>', _on_hilo_press)
+        canvas.tag_bind(tag, '<Enter>', _on_hilo_enter)
+        canvas.tag_bind(tag, '<Leave>', _on_hilo_leave)
+    return canvas
+
+
+# Shared card back images keyed by (width, height), rendered on first use
+_CARD_BACK_IMAGES = {}
+
+
+def _in_rounded_rect(px, py, x1, y1, x2, y2, radius):
+    """Check whether a point lies inside a rounded rectangle"""
+    if px < x1 or px > x2 or py < y1 or py > y2:
+        return False
+    cx = min(max(px, x1 + radius), x2 - radius)
+    cy = min(max(py, y1 + radius), y2 - radius)
+    return (px - cx) ** 2 + (py - cy) ** 2 <= radius ** 2
+
+
+def _render_card_back_pixels(width, height):
+    """
+    Render the card back artwork into PhotoImage row data.
     
-    # Card bounds - same as front card for consistency
+    This is the only definition of the card back: a burgundy card with a
+    darker 2 px outline and drop shadow, a cream 2 px inner border, a
+    12 px diagonal crosshatch and a cream diamond ornament in the centre.
+    It runs once per card size (see get_card_back_image), so every hidden
+    card, deck card and discard stack shares one image.
+    
+    Returns:
+        String of '{#rrggbb ...}' rows suitable for PhotoImage.put
+    """
+    bg = COLORS['bg_card_table']
+    back = COLORS['card_back']
+    back_outline = darken_color(back, 0.7)
+    pattern = COLORS['card_back_pattern']
+    pattern_outline = darken_color(pattern, 0.8)
+    shadow = '#1a1512'
+    
+    # Card bounds - same as the card front
     padding = 3
     shadow_offset = 2
     card_left = padding
     card_top = padding
     card_right = width - padding - shadow_offset
     card_bottom = height - padding - shadow_offset
-    card_w = card_right - card_left
-    card_h = card_bottom - card_top
+    radius = CARD_CORNER_RADIUS
     
-    # Card shadow
-    create_rounded_rect(
-        canvas, 
-        card_left + shadow_offset, card_top + shadow_offset, 
-        card_right + shadow_offset, card_bottom + shadow_offset,
-        CARD_CORNER_RADIUS,
-        fill='#1a1512', outline=''
-    )
-    
-    # Main card background - rich burgundy
-    create_rounded_rect(
-        canvas, 
-        card_left, card_top, card_right, card_bottom,
-        CARD_CORNER_RADIUS,
-        fill=COLORS['card_back'], outline=darken_color(COLORS['card_back'], 0.7), width=2
-    )
-    
-    # Outer decorative border
     border_margin = 8
     inner_left = card_left + border_margin
     inner_top = card_top + border_margin
     inner_right = card_right - border_margin
     inner_bottom = card_bottom - border_margin
     
-    create_rounded_rect(
-        canvas,
-        inner_left, inner_top, inner_right, inner_bottom,
-        CARD_CORNER_RADIUS - 3,
-        fill='', outline=COLORS['card_back_pattern'], width=2
-    )
-    
-    # Inner area for pattern
     pattern_margin = 12
     pattern_left = card_left + pattern_margin
     pattern_top = card_top + pattern_margin
     pattern_right = card_right - pattern_margin
     pattern_bottom = card_bottom - pattern_margin
-    pattern_w = pattern_right - pattern_left
-    pattern_h = pattern_bottom - pattern_top
-    
-    # Draw crosshatch/diamond pattern using lines
+    pattern_h = int(pattern_bottom - pattern_top)
     line_spacing = 12
-    pattern_color = COLORS['card_back_pattern']
-    
-    # Diagonal lines from top-left to bottom-right
-    for i in range(-int(pattern_h), int(pattern_w) + int(pattern_h), line_spacing):
-        x1 = pattern_left + i
-        y1 = pattern_top
-        x2 = pattern_left + i + pattern_h
-        y2 = pattern_bottom
-        
-        # Clip to pattern bounds
-        if x1 < pattern_left:
-            y1 = pattern_top + (pattern_left - x1)
-            x1 = pattern_left
-        if x2 > pattern_right:
-            y2 = pattern_bottom - (x2 - pattern_right)
-            x2 = pattern_right
-        if y1 < pattern_top or y2 > pattern_bottom:
-            continue
-        if x1 <= pattern_right and x2 >= pattern_left:
-            canvas.create_line(x1, y1, x2, y2, fill=pattern_color, width=1)
-    
-    # Diagonal lines from top-right to bottom-left
-    for i in range(-int(pattern_h), int(pattern_w) + int(pattern_h), line_spacing):
-        x1 = pattern_right - i
-        y1 = pattern_top
-        x2 = pattern_right - i - pattern_h
-        y2 = pattern_bottom
-        
-        # Clip to pattern bounds
-        if x1 > pattern_right:
-            y1 = pattern_top + (x1 - pattern_right)
-            x1 = pattern_right
-        if x2 < pattern_left:
-            y2 = pattern_bottom - (pattern_left - x2)
-            x2 = pattern_left
-        if y1 < pattern_top or y2 > pattern_bottom:
-            continue
-        if x1 >= pattern_left and x2 <= pattern_right:
-            canvas.create_line(x1, y1, x2, y2, fill=pattern_color, width=1)
     
-    # Inner decorative border (covers pattern edges)
-    create_rounded_rect(
-        canvas,
-        inner_left, inner_top, inner_right, inner_bottom,
-        CARD_CORNER_RADIUS - 3,
-        fill='', outline=COLORS['card_back_pattern'], width=2
-    )
-    
-    # Center ornament - larger diamond with fill
-    center_x = card_left + card_w // 2
-    center_y = card_top + card_h // 2
+    center_x = card_left + (card_right - card_left) // 2
+    center_y = card_top + (card_bottom - card_top) // 2
     ornament_size = 10
     
-    # Diamond background
-    canvas.create_polygon(
-        center_x, center_y - ornament_size - 2,
-        center_x + ornament_size + 2, center_y,
-        center_x, center_y + ornament_size + 2,
-        center_x - ornament_size - 2, center_y,
-        fill=COLORS['card_back'], outline=''
+    rows = []
+    for y in range(height):
+        py = y + 0.5
+        row = []
+        for x in range(width):
+            px = x + 0.5
+            if not _in_rounded_rect(px, py, card_left, card_top, card_right, card_bottom, radius):
+                # Outside the card - shadow or table felt
+                inside_shadow = _in_rounded_rect(
+                    px, py,
+                    card_left + shadow_offset, card_top + shadow_offset,
+                    card_right + shadow_offset, card_bottom + shadow_offset,
+                    radius
+                )
+                row.append(shadow if inside_shadow else bg)
+                continue
+                
+            diamond = abs(x - center_x) + abs(y - center_y)
+            if diamond <= ornament_size - 1:
+                color = pattern
+            elif diamond <= ornament_size:
+                color = pattern_outline
+            elif diamond <= ornament_size + 2:
+                color = back
+            elif not _in_rounded_rect(px, py, card_left + 2, card_top + 2,
+                                      card_right - 2, card_bottom - 2, radius - 2):
+                color = back_outline
+            elif (_in_rounded_rect(px, py, inner_left - 1, inner_top - 1,
+                                   inner_right + 1, inner_bottom + 1, radius - 2) and
+                  not _in_rounded_rect(px, py, inner_left + 1, inner_top + 1,
+                                       inner_right - 1, inner_bottom - 1, radius - 4)):
+                color = pattern
+            elif (pattern_left <= x <= pattern_right and pattern_top <= y <= pattern_bottom and
+                  ((x - pattern_left - (y - pattern_top) + pattern_h) % line_spacing == 0 or
+                   (pattern_right - x - (y - pattern_top) + pattern_h) % line_spacing == 0)):
+                color = pattern
+            else:
+                color = back
+            row.append(color)
+        rows.append('{' + ' '.join(row) + '}')
+    return ' '.join(rows)
+
+
+def get_card_back_image(width=CARD_WIDTH, height=CARD_HEIGHT):
+    """
+    Get the shared card back PhotoImage for a size, rendering it on first use.
+    
+    A Tk root must exist before the first call.
+    
+    Returns:
+        PhotoImage of the card back
+    """
+    key = (width, height)
+    image = _CARD_BACK_IMAGES.get(key)
+    if image is None:
+        image = tk.PhotoImage(width=width, height=height)
+        image.put(_render_card_back_pixels(width, height))
+        _CARD_BACK_IMAGES[key] = image
+    return image
+
+
+def create_card_back_label(parent, width=CARD_WIDTH, height=CARD_HEIGHT):
+    """
+    Create a lightweight card back showing the shared card back image.
+    
+    Returns:
+        Label widget representing card back
+    """
+    return tk.Label(
+        parent,
+        image=get_card_back_image(width, height),
+        bd=0, padx=0, pady=0,
+        highlightthickness=0,
+        bg=COLORS['bg_card_table']
     )
-    # Diamond outline
-    canvas.create_polygon(
-        center_x, center_y - ornament_size,
-        center_x + ornament_size, center_y,
-        center_x, center_y + ornament_size,
-        center_x - ornament_size, center_y,
-        fill=COLORS['card_back_pattern'], outline=darken_color(COLORS['card_back_pattern'], 0.8), width=1
+
+
+# Pip positions per rank as (x, y, inverted, large) fractions of the pip area:
+# x 0 / 0.5 / 1 = left / center / right column, y 0 = top row, 1 = bottom row
+_PIP_LAYOUTS = {
+    'A': ((0.5, 0.5, False, True),),
+    '2': ((0.5, 0, False, False), (0.5, 1, True, False)),
+    '3': ((0.5, 0, False, False), (0.5, 0.5, False, False), (0.5, 1, True, False)),
+    '4': ((0, 0, False, False), (1, 0, False, False),
+          (0, 1, True, False), (1, 1, True, False)),
+    '5': ((0, 0, False, False), (1, 0, False, False), (0.5, 0.5, False, False),
+          (0, 1, True, False), (1, 1, True, False)),
+    '6': ((0, 0, False, False), (1, 0, False, False),
+          (0, 0.5, False, False), (1, 0.5, False, False),
+          (0, 1, True, False), (1, 1, True, False)),
+    # Six in grid plus one upper center
+    '7': ((0, 0, False, False), (1, 0, False, False), (0.5, 0.25, False, False),
+          (0, 0.5, False, False), (1, 0.5, False, False),
+          (0, 1, True, False), (1, 1, True, False)),
+    # Six in grid plus two center
+    '8': ((0, 0, False, False), (1, 0, False, False), (0.5, 0.25, False, False),
+          (0, 0.5, False, False), (1, 0.5, False, False), (0.5, 0.75, True, False),
+          (0, 1, True, False), (1, 1, True, False)),
+    # 4-1-4 pattern
+    '9': ((0, 0, False, False), (1, 0, False, False),
+          (0, 1 / 3, False, False), (1, 1 / 3, False, False), (0.5, 0.5, False, False),
+          (0, 2 / 3, True, False), (1, 2 / 3, True, False),
+          (0, 1, True, False), (1, 1, True, False)),
+    # 4-2-4 pattern
+    '10': ((0, 0, False, False), (1, 0, False, False), (0.5, 1 / 6, False, False),
+           (0, 1 / 3, False, False), (1, 1 / 3, False, False),
+           (0, 2 / 3, True, False), (1, 2 / 3, True, False), (0.5, 5 / 6, True, False),
+           (0, 1, True, False), (1, 1, True, False)),
+}
+
+
+# Per-card face attributes: (suit symbol, suit color, rank font key, show corner suits)
+_CARD_META = {
+    (rank, suit): (
+        SUIT_SYMBOLS[suit],
+        COLORS['card_red'] if suit in ('hearts', 'diamonds') else COLORS['card_black'],
+        'card_rank_10' if rank == '10' else 'card_rank',
+        rank in ('A', 'J', 'Q', 'K'),
     )
-    
-    return canvas
+    for rank in RANKS for suit in SUITS
+}
+
+
+# Hi-Lo badge (text color, label, background) per count value
+_HILO_BADGES = {
+    1: (COLORS['success'], '+1', '#1a3d2a'),   # Dark green background
+    0: (COLORS['warning'], '0', '#3d3d1a'),    # Dark yellow background
+    -1: (COLORS['danger'], '-1', '#3d1a1a'),   # Dark red background
+}
 
 
 def _draw_card_pips(canvas, rank, suit_symbol, suit_color, card_x, card_y, card_w, card_h):
@@ -220,171 +366,44 @@ def _draw_card_pips(canvas, rank, suit_symbol, suit_color, card_x, card_y, card_
     # Define the pip area (leaving room for corner numbers)
     # More generous margins to avoid overlap with corner text
     pip_area_top = card_y + card_h * 0.28
-    pip_area_bottom = card_y + card_h * 0.72
     pip_area_left = card_x + card_w * 0.22
-    pip_area_right = card_x + card_w * 0.78
-    
-    pip_area_h = pip_area_bottom - pip_area_top
-    pip_area_w = pip_area_right - pip_area_left
-    
-    # Column positions (left, center, right)
-    left_x = pip_area_left
-    center_x = card_x + card_w // 2
-    right_x = pip_area_right
-    
-    # Row positions within pip area
-    top_y = pip_area_top
-    row_2 = pip_area_top + pip_area_h * 0.25
-    mid_y = pip_area_top + pip_area_h * 0.5
-    row_4 = pip_area_top + pip_area_h * 0.75
-    bottom_y = pip_area_bottom
-    
-    # Pip font size - scaled for larger cards
-    pip_font = ('Arial', 13)
-    pip_font_large = ('Arial', 28)
-    pip_font_face = ('Georgia', 20, 'bold')
-    
-    def draw_pip(x, y, inverted=False, font=pip_font):
-        """Draw a single pip, optionally inverted"""
-        canvas.create_text(x, y, text=suit_symbol, font=font, 
-                          fill=suit_color, anchor='center', 
-                          angle=180 if inverted else 0)
-    
-    if rank == 'A':
-        # Ace - one large center pip
-        draw_pip(center_x, card_y + card_h // 2, font=pip_font_large)
-        
-    elif rank == '2':
-        # Two pips - top and bottom center
-        draw_pip(center_x, top_y)
-        draw_pip(center_x, bottom_y, inverted=True)
-        
-    elif rank == '3':
-        # Three pips - column of three
-        draw_pip(center_x, top_y)
-        draw_pip(center_x, mid_y)
-        draw_pip(center_x, bottom_y, inverted=True)
-        
-    elif rank == '4':
-        # Four pips - corners of pip area
-        draw_pip(left_x, top_y)
-        draw_pip(right_x, top_y)
-        draw_pip(left_x, bottom_y, inverted=True)
-        draw_pip(right_x, bottom_y, inverted=True)
-        
-    elif rank == '5':
-        # Five pips - corners plus center
-        draw_pip(left_x, top_y)
-        draw_pip(right_x, top_y)
-        draw_pip(center_x, mid_y)
-        draw_pip(left_x, bottom_y, inverted=True)
-        draw_pip(right_x, bottom_y, inverted=True)
-        
-    elif rank == '6':
-        # Six pips - two columns of three
-        draw_pip(left_x, top_y)
-        draw_pip(right_x, top_y)
-        draw_pip(left_x, mid_y)
-        draw_pip(right_x, mid_y)
-        draw_pip(left_x, bottom_y, inverted=True)
-        draw_pip(right_x, bottom_y, inverted=True)
-        
-    elif rank == '7':
-        # Seven pips - six in grid plus one upper center
-        draw_pip(left_x, top_y)
-        draw_pip(right_x, top_y)
-        draw_pip(center_x, row_2)
-        draw_pip(left_x, mid_y)
-        draw_pip(right_x, mid_y)
-        draw_pip(left_x, bottom_y, inverted=True)
-        draw_pip(right_x, bottom_y, inverted=True)
-        
-    elif rank == '8':
-        # Eight pips - six in grid plus two center
-        draw_pip(left_x, top_y)
-        draw_pip(right_x, top_y)
-        draw_pip(center_x, row_2)
-        draw_pip(left_x, mid_y)
-        draw_pip(right_x, mid_y)
-        draw_pip(center_x, row_4, inverted=True)
-        draw_pip(left_x, bottom_y, inverted=True)
-        draw_pip(right_x, bottom_y, inverted=True)
-        
-    elif rank == '9':
-        # Nine pips - 4-1-4 pattern
-        third_h = pip_area_h / 3
-        draw_pip(left_x, top_y)
-        draw_pip(right_x, top_y)
-        draw_pip(left_x, top_y + third_h)
-        draw_pip(right_x, top_y + third_h)
-        draw_pip(center_x, mid_y)
-        draw_pip(left_x, bottom_y - third_h, inverted=True)
-        draw_pip(right_x, bottom_y - third_h, inverted=True)
-        draw_pip(left_x, bottom_y, inverted=True)
-        draw_pip(right_x, bottom_y, inverted=True)
-        
-    elif rank == '10':
-        # Ten pips - 4-2-4 pattern
-        third_h = pip_area_h / 3
-        draw_pip(left_x, top_y)
-        draw_pip(right_x, top_y)
-        draw_pip(center_x, top_y + third_h * 0.5)
-        draw_pip(left_x, top_y + third_h)
-        draw_pip(right_x, top_y + third_h)
-        draw_pip(left_x, bottom_y - third_h, inverted=True)
-        draw_pip(right_x, bottom_y - third_h, inverted=True)
-        draw_pip(center_x, bottom_y - third_h * 0.5, inverted=True)
-        draw_pip(left_x, bottom_y, inverted=True)
-        draw_pip(right_x, bottom_y, inverted=True)
-        
+    pip_area_h = card_h * 0.44
+    pip_area_w = card_w * 0.56
+    
+    layout = _PIP_LAYOUTS.get(rank)
+    if layout is not None:
+        pip_font = get_font('card_pip')
+        pip_font_large = get_font('card_pip_large')
+        for fx, fy, inverted, large in layout:
+            canvas.create_text(pip_area_left + pip_area_w * fx, pip_area_top + pip_area_h * fy,
+                               text=suit_symbol, font=pip_font_large if large else pip_font,
+                               fill=suit_color, anchor='center',
+                               angle=180 if inverted else 0)
+                               
     elif rank in ['J', 'Q', 'K']:
         # Face cards - letter with suit
+        center_x = card_x + card_w // 2
         face_center_y = card_y + card_h // 2
         canvas.create_text(
             center_x, face_center_y - 8,
             text=rank,
-            font=pip_font_face,
+            font=get_font('card_face_rank'),
             fill=suit_color,
             anchor='center'
         )
         canvas.create_text(
             center_x, face_center_y + 16,
             text=suit_symbol,
-            font=('Arial', 16),
+            font=get_font('card_face_suit'),
             fill=suit_color,
             anchor='center'
         )
 
 
-def create_card_front_canvas(parent, card, show_hilo=True, training_mode=True, 
-                             width=CARD_WIDTH, height=CARD_HEIGHT, on_hilo_click=None):
-    """
-    Create a classic flat-style card front using Canvas.
-    
-    Args:
-        parent: Parent tkinter widget
-        card: Tuple of (rank, suit)
-        show_hilo: If True and training_mode, show Hi-Lo value
-        training_mode: If True, Hi-Lo values can be shown
-        width: Card width in pixels
-        height: Card height in pixels
-        on_hilo_click: Optional callback when Hi-Lo badge is clicked
-        
-    Returns:
-        Canvas widget representing card front
-    """
-    rank, suit = card
-    is_red = suit in ['hearts', 'diamonds']
-    suit_color = COLORS['card_red'] if is_red else COLORS['card_black']
-    suit_symbol = SUIT_SYMBOLS[suit]
-    
-    canvas = tk.Canvas(
-        parent, 
-        width=width, 
-        height=height, 
-        bg=COLORS['bg_card_table'],
-        highlightthickness=0
-    )
+def _draw_card_front(canvas, card, show_hilo, training_mode, width, height, on_hilo_click):
+    """Draw a card face onto an existing canvas"""
+    rank = card[0]
+    suit_symbol, suit_color, rank_font_key, show_corner_suits = _CARD_META[card]
     
     # Card bounds - leave room for shadow
     padding = 3
@@ -433,17 +452,14 @@ def create_card_front_canvas(parent, card, show_hilo=True, training_mode=True,
     
     # Rank display - larger fonts for bigger cards
     rank_display = rank
-    rank_font_size = 11 if rank == '10' else 13
-    suit_font_size = 10
-    
-    # Determine if we should show corner suits (only for A, J, Q, K)
-    show_corner_suits = rank in ['A', 'J', 'Q', 'K']
+    rank_font = get_font(rank_font_key)
+    suit_font = get_font('card_corner_suit')
     
     # Top-left corner
     canvas.create_text(
         card_left + corner_x, card_top + corner_y,
         text=rank_display,
-        font=('Arial', rank_font_size, 'bold'),
+        font=rank_font,
         fill=suit_color,
         anchor='center'
     )
@@ -451,7 +467,7 @@ def create_card_front_canvas(parent, card, show_hilo=True, training_mode=True,
         canvas.create_text(
             card_left + corner_x, card_top + corner_y + 13,
             text=suit_symbol,
-            font=('Arial', suit_font_size),
+            font=suit_font,
             fill=suit_color,
             anchor='center'
         )
@@ -461,14 +477,14 @@ def create_card_front_canvas(parent, card, show_hilo=True, training_mode=True,
         canvas.create_text(
             card_right - corner_x, card_bottom - corner_y - 13,
             text=suit_symbol,
-            font=('Arial', suit_font_size),
+            font=suit_font,
             fill=suit_color,
             anchor='center'
         )
     canvas.create_text(
         card_right - corner_x, card_bottom - corner_y,
         text=rank_display,
-        font=('Arial', rank_font_size, 'bold'),
+        font=rank_font,
         fill=suit_color,
         anchor='center'
     )
@@ -484,19 +500,7 @@ def create_card_front_canvas(parent, card, show_hilo=True, training_mode=True,
     badge_height = 18
     
     if show_hilo and training_mode:
-        hilo = get_hilo_value(card)
-        if hilo > 0:
-            hilo_color = COLORS['success']
-            hilo_text = f"+{hilo}"
-            badge_bg = '#1a3d2a'  # Dark green background
-        elif hilo < 0:
-            hilo_color = COLORS['danger']
-            hilo_text = str(hilo)
-            badge_bg = '#3d1a1a'  # Dark red background
-        else:
-            hilo_color = COLORS['warning']
-            hilo_text = "0"
-            badge_bg = '#3d3d1a'  # Dark yellow background
+        hilo_color, hilo_text, badge_bg = _HILO_BADGES[get_hilo_value(card)]
         
         # Rounded rectangle badge
         create_rounded_rect(
@@ -510,85 +514,78 @@ def create_card_front_canvas(parent, card, show_hilo=True, training_mode=True,
         canvas.create_text(
             center_x, badge_y,
             text=hilo_text,
-            font=('Consolas', 11, 'bold'),
+            font=get_font('card_hilo'),
             fill=hilo_color,
             anchor='center',
             tags='hilo_badge'
         )
     
-    # Bind click handler to the Hi-Lo badge area (works even when hidden for toggle)
-    if on_hilo_click and training_mode:
+    # Click handler for the Hi-Lo badge area (works even when hidden for toggle) -
+    # the canvas's tag bindings call whatever callback is stored here
+    canvas.on_hilo_click = on_hilo_click if training_mode else None
+    if canvas.on_hilo_click:
         # Create invisible clickable area at badge position
-        click_area = canvas.create_rectangle(
+        canvas.create_rectangle(
             center_x - badge_width // 2 - 5, badge_y - badge_height // 2 - 5,
             center_x + badge_width // 2 + 5, badge_y + badge_height // 2 + 5,
             fill='', outline='', tags='hilo_click'
         )
-        canvas.tag_bind('hilo_click', '<Button-1>', lambda e: on_hilo_click())
-        canvas.tag_bind('hilo_badge', '<Button-1>', lambda e: on_hilo_click())
-        # Change cursor on hover over badge area
-        canvas.tag_bind('hilo_click', '<Enter>', lambda e: canvas.config(cursor='hand2'))
-        canvas.tag_bind('hilo_click', '<Leave>', lambda e: canvas.config(cursor=''))
-        canvas.tag_bind('hilo_badge', '<Enter>', lambda e: canvas.config(cursor='hand2'))
-        canvas.tag_bind('hilo_badge', '<Leave>', lambda e: canvas.config(cursor=''))
-    
-    return canvas
 
 
-def create_card_widget(parent, card, hidden=False, show_hilo=True, training_mode=True, on_hilo_click=None):
+def update_card_widget(canvas, card, hidden=False, show_hilo=True, training_mode=True, on_hilo_click=None):
     """
-    Create a premium card widget using Canvas rendering.
+    Redraw an existing card canvas in place to show a different card or state.
+    
+    Lets card widgets be reused instead of destroyed and recreated.
     
     Args:
-        parent: Parent tkinter frame
+        canvas: Card canvas created by create_card_canvas
         card: Tuple of (rank, suit)
         hidden: If True, show card back
         show_hilo: If True and training_mode, show Hi-Lo value
         training_mode: If True, Hi-Lo values can be shown
         on_hilo_click: Optional callback when Hi-Lo badge is clicked
-        
-    Returns:
-        Canvas widget for the card
     """
+    canvas.delete('all')
+    canvas.config(cursor='')
+    canvas.on_hilo_click = None
+    width = int(canvas['width'])
+    height = int(canvas['height'])
     if hidden:
-        return create_card_back_canvas(parent)
+        # One image item showing the shared card back
+        canvas.create_image(0, 0, image=get_card_back_image(width, height), anchor='nw')
     else:
-        return create_card_front_canvas(parent, card, show_hilo, training_mode, on_hilo_click=on_hilo_click)
+        _draw_card_front(canvas, card, show_hilo, training_mode, width, height, on_hilo_click)
 
 
-def create_mini_card_back(parent, width=30, height=42):
-    """Create a smaller card back for the discard pile display"""
-    canvas = tk.Canvas(
-        parent,
-        width=width,
-        height=height,
-        bg=COLORS['bg_card_table'],
-        highlightthickness=0
-    )
-    
-    # Card dimensions
-    card_x = 1
-    card_y = 1
-    card_w = width - 4
-    card_h = height - 4
-    
-    # Simple card back
-    create_rounded_rect(
-        canvas,
-        card_x, card_y, card_x + card_w, card_y + card_h,
-        3,
-        fill=COLORS['card_back'], outline=darken_color(COLORS['card_back'], 0.7), width=1
-    )
+# Composited discard stacks keyed by (num_visible, max_visible, stack_offset)
+_DISCARD_PILE_IMAGES = {}
+
+
+def get_discard_pile_image(num_visible, max_visible=5, stack_offset=2):
+    """
+    Get a stack of card backs composited into one PhotoImage.
     
-    # Simple inner border
-    create_rounded_rect(
-        canvas,
-        card_x + 2, card_y + 2, card_x + card_w - 2, card_y + card_h - 2,
-        2,
-        fill='', outline=COLORS['card_back_pattern'], width=1
-    )
+    Cards sit at the bottom-right of a max_visible-sized area so every
+    stack height lines up with the deck visual. Rendered on first use.
     
-    return canvas
+    Returns:
+        PhotoImage of the stacked card backs
+    """
+    key = (num_visible, max_visible, stack_offset)
+    image = _DISCARD_PILE_IMAGES.get(key)
+    if image is None:
+        width = CARD_WIDTH + (max_visible - 1) * stack_offset + 4
+        height = CARD_HEIGHT + (max_visible - 1) * stack_offset + 4
+        image = tk.PhotoImage(width=width, height=height)
+        image.put(COLORS['bg_card_table'], to=(0, 0, width, height))
+        back = get_card_back_image()
+        offset_start = (max_visible - num_visible) * stack_offset
+        for i in range(num_visible):
+            offset = offset_start + i * stack_offset
+            image.tk.call(image, 'copy', back, '-to', offset, offset)
+        _DISCARD_PILE_IMAGES[key] = image
+    return image
 
 
 def create_discard_pile_widget(parent, card_count=0, max_visible=5):
@@ -636,12 +633,14 @@ def create_discard_pile_widget(parent, card_count=0, max_visible=5):
         # Position placeholder at bottom-right to match stacked card position
         placeholder.place(x=(max_visible - 1) * stack_offset, y=(max_visible - 1) * stack_offset)
     else:
-        # Use actual card back canvases (same as deck visual)
-        for i in range(num_visible):
-            card_back = create_card_back_canvas(stack_container)
-            # Offset from end position to match deck visual alignment
-            offset_start = (max_visible - num_visible) * stack_offset
-            card_back.place(x=offset_start + i * stack_offset, y=offset_start + i * stack_offset)
+        # One pre-composited image for the whole stack (same look as deck visual)
+        tk.Label(
+            stack_container,
+            image=get_discard_pile_image(num_visible, max_visible, stack_offset),
+            bd=0, padx=0, pady=0,
+            highlightthickness=0,
+            bg=COLORS['bg_card_table']
+        ).place(x=0, y=0)
     
     # Set container size - always same size for consistent alignment
     stack_container.config(width=total_width, height=total_height)
@@ -651,7 +650,7 @@ def create_discard_pile_widget(parent, card_count=0, max_visible=5):
     tk.Label(
         frame,
         text="DISCARDED",
-        font=('Trebuchet MS', 8),
+        font=get_font('label'),
         bg=COLORS['bg_card_table'],
         fg=COLORS['text_muted']
     ).pack(pady=(3, 0))
@@ -663,7 +662,7 @@ def create_discard_pile_widget(parent, card_count=0, max_visible=5):
     count_label = tk.Label(
         badge_frame,
         text=f"{card_count}",
-        font=('Consolas', 10, 'bold'),
+        font=get_font('mono_badge'),
         bg=COLORS['bg_elevated'],
         fg=COLORS['text_primary']
     )
@@ -672,19 +671,55 @@ def create_discard_pile_widget(parent, card_count=0, max_visible=5):
     return frame
 
 
+# Named Tk fonts created by setup_fonts(), keyed like FONTS
+_NAMED_FONTS = {}
+
+
+def get_font(key):
+    """
+    Get the shared font for a FONTS key.
+    
+    Returns:
+        The named Tk font once setup_fonts() has run, else the FONTS descriptor tuple
+    """
+    return _NAMED_FONTS.get(key) or FONTS[key]
+
+
+def setup_fonts(root=None):
+    """
+    Register every FONTS entry as a named Tk font.
+    
+    Widgets built through get_font() then share one font object by name
+    instead of Tk parsing a descriptor tuple for each label. Must run after
+    the Tk root exists; calling it again for the same root is a no-op.
+    """
+    existing = set(tkfont.names(root))
+    for key, (family, size, *style) in FONTS.items():
+        name = f"bj_{key}"
+        if key in _NAMED_FONTS and name in existing:
+            continue
+        # A fresh root (new Tcl interpreter) gets its own copy of each font
+        _NAMED_FONTS[key] = tkfont.Font(
+            root, name=name, exists=name in existing, family=family, size=size,
+            weight='bold' if 'bold' in style else 'normal',
+            slant='italic' if 'italic' in style else 'roman'
+        )
+
+
+# Set once the ttk theme has been configured for the application's root
+_STYLES_DONE = False
+
+
 def setup_ttk_styles():
-    """Configure ttk styles for an elegant appearance"""
+    """Configure ttk styles for an elegant appearance (only the first call applies)"""
+    global _STYLES_DONE
+    if _STYLES_DONE:
+        return
+    _STYLES_DONE = True
+    
     style = ttk.Style()
     style.theme_use('clam')
     
-    # Progress bar style - more muted gold
-    style.configure("Gold.Horizontal.TProgressbar",
-                   troughcolor=COLORS['bg_elevated'],
-                   background=COLORS['gold'],
-                   bordercolor=COLORS['bg_elevated'],
-                   lightcolor=COLORS['gold_light'],
-                   darkcolor=COLORS['gold_dim'])
-    
     # Combobox style
     style.configure("TCombobox",
                    fieldbackground=COLORS['bg_elevated'],